@@ -1,6 +1,6 @@
 import os
-import json
 from typing import Optional, Dict, Any
+from drlite.data.loaders import load_json
 
 # ==============================================================================
 #  PATHFINDER: El sistema de rutas dinámicas
@@ -10,12 +10,29 @@ PROJECT_ROOT = os.path.dirname(os.path.dirname(CURRENT_DIR))
 DATA_DIR = os.path.join(PROJECT_ROOT, "data")
 IMG_DIR = os.path.join(PROJECT_ROOT, "img")
 _ASSETS_MANIFEST: Dict[str, Any] = {}
+# demon id -> absolute portrait path, flattened from mappings + sources at load
+_PORTRAIT_PATHS: Dict[str, str] = {}
+
+def _build_portrait_paths(manifest: Dict[str, Any]) -> Dict[str, str]:
+    """Resuelve cada mapping (source + key) a su ruta absoluta, una sola vez."""
+    sources = manifest.get("sources", {})
+    paths: Dict[str, str] = {}
+    for d_id, entry in manifest.get("mappings", {}).items():
+        if not entry:
+            continue
+        src_config = sources.get(entry.get("source"))
+        if not src_config:
+            continue
+        root_folder = src_config.get("root", "")
+        ext = src_config.get("ext", ".png")
+        paths[d_id] = os.path.join(IMG_DIR, root_folder, f"{entry.get('key')}{ext}")
+    return paths
 
 def load_assets_manifest(filename: str = "assets_manifest.json") -> Dict[str, Any]:
     """
     Carga el JSON de configuración de assets desde la carpeta 'data/'.
     """
-    global _ASSETS_MANIFEST
+    global _ASSETS_MANIFEST, _PORTRAIT_PATHS
     
     full_path = os.path.join(DATA_DIR, filename)
     
@@ -24,8 +41,9 @@ def load_assets_manifest(filename: str = "assets_manifest.json") -> Dict[str, An
         return {}
 
     try:
-        with open(full_path, "r", encoding="utf-8") as f:
-            _ASSETS_MANIFEST = json.load(f)
+        # Shared mtime-keyed cache: a reload of an unchanged manifest is just a stat()
+        _ASSETS_MANIFEST = load_json(full_path)
+        _PORTRAIT_PATHS = _build_portrait_paths(_ASSETS_MANIFEST)
         
         # Debug info
         count = len(_ASSETS_MANIFEST.get('sources', {}))
@@ -49,27 +67,8 @@ def get_portrait_path(demon_id: str | Any, expression: str = "default") -> Optio
 
     d_id = getattr(demon_id, "id", str(demon_id))
 
-    mappings = _ASSETS_MANIFEST.get("mappings", {})
-    entry = mappings.get(d_id)
-    
-    if not entry:
-        return None
-
-    source_key = entry.get("source") 
-    img_key = entry.get("key")       
-    
-
-    sources = _ASSETS_MANIFEST.get("sources", {})
-    src_config = sources.get(source_key)
-    
-    if not src_config:
-        return None
-    root_folder = src_config.get("root", "")
-    ext = src_config.get("ext", ".png")
-
-    full_path = os.path.join(IMG_DIR, root_folder, f"{img_key}{ext}")
-    
-    if os.path.exists(full_path):
+    full_path = _PORTRAIT_PATHS.get(d_id)
+    if full_path and os.path.exists(full_path):
         return full_path
     
-    return None
\ No newline at end of file
+    return None
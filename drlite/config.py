@@ -1,5 +1,7 @@
 from __future__ import annotations
-import json, random
+import os, random
+from dataclasses import dataclass
+from drlite.utils import json_loads, read_bytes
 from typing import Optional
 
 RAPPORT_MIN, RAPPORT_MAX = -3, 3
@@ -9,29 +11,55 @@ RNG_SEED: Optional[int]  = None
 ROUND_DELAY_SEC          = 0
 SAVE_PATH                = "saves/slot1.json"
 
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """Immutable snapshot of the values above; replaced as a whole by load_config()."""
+    rapport_min: int
+    rapport_max: int
+    axis_min: int
+    axis_max: int
+    tol_min: int
+    tol_max: int
+    rng_seed: Optional[int]
+    round_delay_sec: int
+
+def _snapshot() -> Settings:
+    return Settings(RAPPORT_MIN, RAPPORT_MAX, AXIS_MIN, AXIS_MAX,
+                    TOL_MIN, TOL_MAX, RNG_SEED, ROUND_DELAY_SEC)
+
+# Read as `config.SETTINGS.x` (not `from drlite.config import ...`) to see reloads
+SETTINGS: Settings = _snapshot()
+
+# (path, mtime_ns) of the last file applied; an unchanged file is not re-parsed
+_LOADED_KEY: Optional[tuple] = None
+
 def load_config(path: str = "config.json") -> None:
     """Load global limits/seed/UI from JSON; keep behavior identical to your current version."""
     global RAPPORT_MIN, RAPPORT_MAX, AXIS_MIN, AXIS_MAX
-    global TOL_MIN, TOL_MAX, RNG_SEED, ROUND_DELAY_SEC
+    global TOL_MIN, TOL_MAX, RNG_SEED, ROUND_DELAY_SEC, SETTINGS, _LOADED_KEY
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            cfg = json.load(f)
+        key = (path, os.stat(path).st_mtime_ns)
+        if key == _LOADED_KEY:
+            # Only the parse is cached: a reload still resets the RNG like before
+            if RNG_SEED is not None:
+                random.seed(RNG_SEED)
+            return
+        cfg = json_loads(read_bytes(path))
     except FileNotFoundError:
         print(f"[config] {path} not found. Using defaults.")
         return
 
-    def g(d, keys, default=None):
-        cur = d
-        for k in keys:
-            if not isinstance(cur, dict) or k not in cur: return default
-            cur = cur[k]
-        return cur
+    def section(name):
+        sec = cfg.get(name)
+        return sec if isinstance(sec, dict) else {}
 
-    rmin = g(cfg, ["rapport","min"], RAPPORT_MIN); rmax = g(cfg, ["rapport","max"], RAPPORT_MAX)
-    amin = g(cfg, ["alignment","min"], AXIS_MIN);  amax = g(cfg, ["alignment","max"], AXIS_MAX)
-    tmin = g(cfg, ["tolerance","min"], TOL_MIN);   tmax = g(cfg, ["tolerance","max"], TOL_MAX)
+    # One dict fetch per section, then plain .get per key
+    rapport, alignment, tolerance = section("rapport"), section("alignment"), section("tolerance")
+    rmin = rapport.get("min", RAPPORT_MIN);   rmax = rapport.get("max", RAPPORT_MAX)
+    amin = alignment.get("min", AXIS_MIN);    amax = alignment.get("max", AXIS_MAX)
+    tmin = tolerance.get("min", TOL_MIN);     tmax = tolerance.get("max", TOL_MAX)
     seed = cfg.get("rng_seed", RNG_SEED)
-    delay = g(cfg, ["ui","round_delay_seconds"], ROUND_DELAY_SEC)
+    delay = section("ui").get("round_delay_seconds", ROUND_DELAY_SEC)
 
     if rmin >= rmax: raise ValueError("rapport.min must be < rapport.max")
     if amin >= amax: raise ValueError("alignment.min must be < alignment.max")
@@ -42,6 +70,8 @@ def load_config(path: str = "config.json") -> None:
     TOL_MIN, TOL_MAX         = int(tmin), int(tmax)
     ROUND_DELAY_SEC          = int(delay or 0)
     RNG_SEED                 = int(seed) if seed is not None else None
+    SETTINGS                 = _snapshot()
+    _LOADED_KEY              = key
 
     if RNG_SEED is not None:
         random.seed(RNG_SEED)
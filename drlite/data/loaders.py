@@ -1,27 +1,73 @@
 import json
 import os
+import sys
 from typing import List, Dict, Any, Tuple
 from drlite.data.types import ItemDef
+from drlite.utils import canonical_item_id, json_loads, normalize_weight_tags, read_bytes
 from drlite.models import (
     Demon, Question, Rarity, 
     Alignment, Personality, ItemEffect
 )
 
+# Parsed files keyed by absolute path -> ((mtime_ns, size), data). Repeated main()/bot sessions
+# reuse the parsed tree until the file changes on disk.
+_JSON_CACHE: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+
 def load_json(path: str) -> Any:
-    if not os.path.exists(path):
+    """
+    Parse a JSON file, reusing the previous result while its mtime is unchanged.
+    NOTE: cached objects are shared between callers; treat them as read-only
+    (the load_* normalizers below build new dicts instead of editing them).
+    """
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
         print(f"[Warning] File not found: {path}")
         return {}
+
+    # Size as well: a rewrite within the filesystem's mtime granularity still shows up
+    stamp = (st.st_mtime_ns, st.st_size)
+    # Absolute key: "data/x.json" from main and DATA_DIR-joined paths share one entry
+    key = os.path.abspath(path)
+    hit = _JSON_CACHE.get(key)
+    if hit is not None and hit[0] == stamp:
+        return hit[1]
+
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        data = json_loads(read_bytes(path))
     except json.JSONDecodeError as e:
         print(f"[Error] Failed to parse JSON {path}: {e}")
         return {}
 
+    _JSON_CACHE[key] = (stamp, data)
+    return data
+
+def _intern_keys(d: Dict[str, Any]) -> Dict[str, Any]:
+    """Shallow copy of `d` with sys.intern'd keys (registry keys are compared constantly)."""
+    return {sys.intern(k): v for k, v in d.items()}
+
+def preload_json(paths: List[str]) -> None:
+    """
+    Warm the JSON cache for several files at once so their reads overlap.
+    The load_* functions then run in their usual order and hit the cache.
+    """
+    paths = [p for p in paths if os.path.exists(p)]
+    if len(paths) < 2:
+        return
+    from concurrent.futures import ThreadPoolExecutor  # deferred: pulls in threading
+    with ThreadPoolExecutor(max_workers=min(8, len(paths))) as pool:
+        list(pool.map(load_json, paths))
+
+# Enum name -> member, built once (a plain dict probe instead of getattr on the Enum class)
+_PERSONALITY_BY_NAME: Dict[str, Personality] = {p.name: p for p in Personality}
+_RARITY_BY_NAME: Dict[str, Rarity] = {r.name: r for r in Rarity}
+_ITEM_EFFECT_BY_NAME: Dict[str, ItemEffect] = {e.name: e for e in ItemEffect}
+
 # ==============================================================================
 #  DEMONS
 # ==============================================================================
 
+
 def load_demons(path: str) -> List[Demon]:
     data = load_json(path)
     if not isinstance(data, list):
@@ -32,15 +78,16 @@ def load_demons(path: str) -> List[Demon]:
             return []
 
     demons = []
+    seen_ids = set() # Save files reference demons by id, so ids must be unique
     for d_data in data:
         try:
             # Parse Rarity Enum safely (Handle lowercase inputs like "common")
             r_str = d_data.get("rarity", "COMMON").upper()
-            rarity = getattr(Rarity, r_str, Rarity.COMMON)
+            rarity = _RARITY_BY_NAME.get(r_str, Rarity.COMMON)
 
             # Parse Personality Enum safely (Handle "PLAYFUL" etc.)
             p_str = d_data.get("personality", "DEFAULT").upper()
-            personality = getattr(Personality, p_str, Personality.DEFAULT)
+            personality = _PERSONALITY_BY_NAME.get(p_str, Personality.DEFAULT)
 
             # Parse Alignment
             align_data = d_data.get("alignment", {})
@@ -49,8 +96,11 @@ def load_demons(path: str) -> List[Demon]:
                 light_dark=align_data.get("light_dark", 0)
             )
 
+            d_id = sys.intern(d_data["id"])
+            if d_id in seen_ids:
+                raise ValueError(f"duplicate id '{d_id}'")
             demon = Demon(
-                id=d_data["id"],
+                id=d_id,
                 dex_no=d_data.get("dex_no", 0),
                 name=d_data["name"],
                 aliases=d_data.get("aliases", []),
@@ -65,6 +115,7 @@ def load_demons(path: str) -> List[Demon]:
                 sprite_key=d_data.get("sprite_key", "")
             )
             demons.append(demon)
+            seen_ids.add(d_id)
         except Exception as e:
             print(f"[Error] Skipping demon {d_data.get('name', 'Unknown')}: {e}")
     
@@ -95,17 +146,34 @@ def load_questions(path: str) -> List[Question]:
     for q_data in raw_list:
         try:
             responses = []
+            events = []
+            merged_tags = []
+            q_tags = normalize_weight_tags(q_data.get("tags"))
             raw_choices = q_data.get("choices", {})
             
             # Convert choice dict to list of tuples
             for choice_text, choice_stats in raw_choices.items():
+                if isinstance(choice_stats, dict):
+                    # Copy: the parsed tree is cached and shared (see load_json)
+                    choice_stats = dict(choice_stats)
+                    choice_stats["tags"] = normalize_weight_tags(choice_stats.get("tags"))
+                    # Numeric deltas are coerced here so the engine can trust them
+                    for key in ("dLC", "dLD", "dRapport"):
+                        if key in choice_stats and type(choice_stats[key]) is not int:
+                            choice_stats[key] = int(choice_stats[key])
                 responses.append((choice_text, choice_stats))
+                evt = choice_stats.get("event") if isinstance(choice_stats, dict) else None
+                events.append(evt if isinstance(evt, dict) else None)
+                choice_tags = choice_stats.get("tags", ()) if isinstance(choice_stats, dict) else ()
+                merged_tags.append(tuple(choice_tags) + tuple(q_tags))
 
             q = Question(
                 id=q_data.get("id", "unknown"),
                 text=q_data["text"],
                 responses=responses,
-                tags=q_data.get("tags", [])
+                tags=q_tags,
+                events=events,
+                merged_tags=merged_tags
             )
             questions.append(q)
         except Exception as e:
@@ -124,13 +192,14 @@ def load_item_catalog(path: str) -> Dict[str, ItemDef]:
     
     raw_items = data if isinstance(data, dict) else {i["id"]: i for i in data}
 
-    for item_id, i_data in raw_items.items():
+    for raw_id, i_data in raw_items.items():
+        item_id = canonical_item_id(raw_id)
         try:
             r_str = i_data.get("rarity", "COMMON").upper()
-            rarity = getattr(Rarity, r_str, Rarity.COMMON)
+            rarity = _RARITY_BY_NAME.get(r_str, Rarity.COMMON)
             
             eff_str = i_data.get("effect_type", "NONE").upper()
-            eff_type = getattr(ItemEffect, eff_str, ItemEffect.NONE)
+            eff_type = _ITEM_EFFECT_BY_NAME.get(eff_str, ItemEffect.NONE)
 
             item = ItemDef(
                 id=item_id, 
@@ -158,23 +227,37 @@ def load_events(path: str) -> Dict[str, Any]:
     if not isinstance(data, dict):
         print("[Error] events.json must be a dictionary.")
         return {}
-    print(f"[Events] Loaded {len(data)} event definitions.")
-    return data
+    # Item references are canonicalized once here, not per event trigger.
+    # Events are copied rather than edited: the parsed tree is cached and shared.
+    registry = {}
+    for ev_id, ev in data.items():
+        if isinstance(ev, dict):
+            ev = dict(ev)
+            for key in ("item_id", "item"):
+                if ev.get(key):
+                    ev[key] = canonical_item_id(ev[key])
+        registry[sys.intern(ev_id)] = ev
+    print(f"[Events] Loaded {len(registry)} event definitions.")
+    return registry
 
 def load_whims(path: str) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
     data = load_json(path)
     config = data.get("config", {})
-    templates = data.get("templates", [])
+    # Whim ids are looked up in the events registry; copied, the cached tree stays untouched
+    templates = [
+        {**t, "id": sys.intern(t["id"])} if isinstance(t.get("id"), str) else t
+        for t in data.get("templates", [])
+    ]
     print(f"[Whims] Loaded {len(templates)} whim templates.")
     return config, templates
 
 def load_personality_weights(path: str) -> Dict[str, Dict[str, float]]:
     data = load_json(path)
     print(f"[weights] Loaded weights for {len(data)} personalities.")
-    return data
+    return {sys.intern(p): _intern_keys(w) if isinstance(w, dict) else w for p, w in data.items()}
 
 def load_personality_cues(path: str) -> Dict[str, List[str]]:
     data = load_json(path)
     total = sum(len(v) for v in data.values())
     print(f"[cues] Loaded {total} cues across {len(data)} personalities.")
-    return data
\ No newline at end of file
+    return _intern_keys(data)
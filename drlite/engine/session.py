@@ -1,16 +1,87 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
-from typing import List, Dict, Set, Optional, Any, Callable
+from typing import List, Dict, Optional, Any, Callable, Tuple
 import random
+import sys
 
+from drlite import config
 from drlite.data.types import ItemDef
-from drlite.config import RAPPORT_MIN, RAPPORT_MAX
 from drlite.models import Player, Demon, Question, ReactionFeedback, EventResult, Rarity, Personality
 from drlite.ui.console import clear_screen
-from drlite.utils import tone_from_delta, flavor_cue, ensure_list_of_str
-
-# Constants
-RNG_SEED = None 
+from drlite.utils import tone_from_delta, flavor_cue, cumulative_weights
+
+# (id(weights), tags) -> (weights, bonus, liked, disliked). The weights dict is
+# kept in the value so a recycled id() can never return a stale entry.
+_TAG_SCORE_CACHE: Dict[Tuple[int, Tuple[str, ...]], Tuple[Dict[str, float], int, Tuple[str, ...], Tuple[str, ...]]] = {}
+_TAG_SCORE_CACHE_MAX = 512
+
+def _tag_score(weights: Dict[str, float], tags: Tuple[str, ...]) -> Tuple[int, Tuple[str, ...], Tuple[str, ...]]:
+    """Personality bonus and liked/disliked split for `tags` (memoized)."""
+    key = (id(weights), tags)
+    hit = _TAG_SCORE_CACHE.get(key)
+    if hit is not None and hit[0] is weights:
+        return hit[1], hit[2], hit[3]
+
+    bonus = 0
+    liked, disliked = [], []
+    for tag in tags:
+        weight = weights.get(tag, 0.0)
+        if weight != 0:
+            bonus += int(5 * weight)
+            (liked if weight > 0 else disliked).append(tag)
+
+    if len(_TAG_SCORE_CACHE) >= _TAG_SCORE_CACHE_MAX:
+        _TAG_SCORE_CACHE.clear()
+    result = (bonus, tuple(liked), tuple(disliked))
+    _TAG_SCORE_CACHE[key] = (weights,) + result
+    return result
+
+# Cumulative whim weights for the last template list seen: (templates, len, cum)
+_WHIM_CUM: Tuple[Optional[List[dict]], int, List[float]] = (None, 0, [])
+
+def _whim_cum_weights(templates: List[dict]) -> List[float]:
+    """Cumulative weights for `templates`, rebuilt only when the list changes."""
+    global _WHIM_CUM
+    src, n, cum = _WHIM_CUM
+    if src is not templates or n != len(templates):
+        cum = cumulative_weights(templates, "weight", default=1)
+        _WHIM_CUM = (templates, len(templates), cum)
+    return cum
+
+# Price/reward scaling by demon rarity (event demands, bribes, XP)
+_DEMAND_MULTIPLIERS: Dict[str, float] = {
+    "COMMON": 1.0, "UNCOMMON": 1.5, "RARE": 3.0, "EPIC": 5.0, "LEGENDARY": 10.0,
+}
+
+# Duplicate-recruit rewards: Macca range and item tier by demon rarity
+_MACCA_REWARD_RANGES: Dict[str, Tuple[int, int]] = {
+    "COMMON": (10, 50), "UNCOMMON": (50, 150), "RARE": (150, 400),
+    "EPIC": (400, 1000), "LEGENDARY": (1000, 5000),
+}
+_RARITY_BY_TIER: Tuple[str, ...] = ("COMMON", "UNCOMMON", "RARE", "EPIC", "LEGENDARY")
+_RARITY_TIERS: Dict[str, int] = {name: tier for tier, name in enumerate(_RARITY_BY_TIER)}
+
+# Bribe chance modifiers by personality / demon rarity, and flee hit chance by personality
+_BRIBE_PERSONALITY_MOD: Dict[str, float] = {"CUNNING": 0.20, "IRRITABLE": 0.10, "UPBEAT": -0.10}
+_BRIBE_RARITY_PENALTY: Dict[str, float] = {"LEGENDARY": 0.4, "EPIC": 0.2, "RARE": 0.1}
+_FLEE_HIT_CHANCE: Dict[str, float] = {"IRRITABLE": 0.8, "TIMID": 0.1}
+
+# Question tags each personality reacts to; first matching substring wins
+_PREFERRED_TAGS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("IRRITABLE", ("AGGRESSIVE", "POWER", "DIRECT")),
+    ("TIMID", ("GENTLE", "SCARED", "SAFETY")),
+    ("UPBEAT", ("FUN", "SOCIAL", "HOBBY")),
+    ("GLOOMY", ("DEATH", "SADNESS", "MEANING")),
+    ("CUNNING", ("TRICK", "VALUE", "SMART")),
+    ("PLAYFUL", ("FUN", "JOKE", "GAME")),
+    ("PROUD", ("HONOR", "POWER", "RESPECT")),
+)
+
+def _preferred_tags_for(p_name: str) -> Tuple[str, ...]:
+    for key, tags in _PREFERRED_TAGS:
+        if key in p_name:
+            return tags
+    return ()
 
 @dataclass
 class NegotiationSession:
@@ -30,25 +101,72 @@ class NegotiationSession:
     round_no: int = 1
     rng: Optional[random.Random] = None
 
+    # Output sink for narration; headless runs pass e.g. `lambda s: None` or `buf.append`
+    log: Callable[[str], None] = field(default=print, repr=False)
+    # Screen wipe before the success banner; headless runs pass a no-op
+    clear: Callable[[], None] = field(default=clear_screen, repr=False)
+    # Long simulations: update one ReactionFeedback in place instead of allocating
+    # per turn (the returned object is then overwritten by the next answer)
+    reuse_feedback: bool = field(default=False, repr=False)
+
     # Patience and tolerance
     max_rounds: int = field(init=False)
     current_tolerance: int = field(init=False)
 
-    # Avoid repeating questions within the session
     last_feedback: Optional[ReactionFeedback] = field(default=None, repr=False)
-    _used_question_ids: Set[str] = field(default_factory = set, repr = False)
+
+    # Avoid repeating questions within the session: indices into question_pool not yet
+    # asked, split into personality-preferred ones and the full fallback set
+    _preferred_idx: List[int] = field(default_factory=list, init=False, repr=False)
+    _remaining_idx: List[int] = field(default_factory=list, init=False, repr=False)
+
+    # Stance -> demon distance, invalidated whenever the stance moves
+    _cached_dist: Optional[int] = field(default=None, init=False, repr=False)
+
+    # Demon personality resolved once; weights row cached per weights table
+    _p_name: str = field(default="", init=False, repr=False)
+    _weights_src: Optional[Dict[str, Dict[str, float]]] = field(default=None, init=False, repr=False)
+    _weights: Dict[str, float] = field(default_factory=dict, init=False, repr=False)
+    # Item rarity index (id -> RARITY, RARITY -> ids in catalog order) per items_catalog
+    _items_src: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False)
+    _item_rarity: Dict[str, str] = field(default_factory=dict, init=False, repr=False)
+    _items_by_rarity: Dict[str, List[str]] = field(default_factory=dict, init=False, repr=False)
+    _item_display: Dict[str, str] = field(default_factory=dict, init=False, repr=False)
+    # Whim trigger chance (base + personality mod) cached per whim config table
+    _whim_cfg_src: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False)
+    _whim_chance: float = field(default=0.0, init=False, repr=False)
+    # Rapport bounds read from config.SETTINGS once per session
+    _rapport_min: int = field(default=0, init=False, repr=False)
+    _rapport_max: int = field(default=0, init=False, repr=False)
 
     def __post_init__(self):
         """Initialize values that depend on demon at runtime."""
         self.max_rounds = getattr(self.demon, "patience", 5)
         self.turns_left = self.max_rounds
         self.current_tolerance = getattr(self.demon, "tolerance", 3)
+        p = self.demon.personality
+        self._p_name = sys.intern((p.name if hasattr(p, "name") else str(p)).upper())
+        self._rapport_min, self._rapport_max = config.SETTINGS.rapport_min, config.SETTINGS.rapport_max
+        self._reset_question_indices()
         
         if self.rng is None:
-            try:
-                self.rng = random.Random(RNG_SEED) if RNG_SEED is not None else random.Random()
-            except NameError:
-                self.rng = random.Random()
+            seed = config.SETTINGS.rng_seed
+            self.rng = random.Random(seed) if seed is not None else random.Random()
+
+    @property
+    def demon_distance(self) -> int:
+        """Manhattan distance between the player's stance and the demon (cached)."""
+        d = self._cached_dist
+        if d is None:
+            a = self.player.stance_alignment
+            b = self.demon.alignment
+            d = abs(a.law_chaos - b.law_chaos) + abs(a.light_dark - b.light_dark)
+            self._cached_dist = d
+        return d
+
+    def invalidate_distance(self) -> None:
+        """Call after mutating the player's stance or the demon's alignment."""
+        self._cached_dist = None
 
     # --- SAFE HELPERS (Para evitar el error 'dict object has no attribute rarity') ---
     def _get_item_rarity_name(self, item_data: Any) -> str:
@@ -68,52 +186,57 @@ class NegotiationSession:
     def _is_item_rarity(self, item_data: Any, target_rarity_name: str) -> bool:
         r_name = self._get_item_rarity_name(item_data)
         return r_name.upper() == target_rarity_name.upper()
+
+    def _rarity_index(self) -> Tuple[Dict[str, str], Dict[str, List[str]]]:
+        """
+        Resolve every catalog item's rarity (and display name, see _item_display) once;
+        rebuilt if the catalog is replaced.
+        """
+        catalog = self.items_catalog
+        if catalog is not self._items_src or len(catalog) != len(self._item_rarity):
+            rarity_of, by_rarity, display = {}, {}, {}
+            for iid, idef in catalog.items():
+                r = self._get_item_rarity_name(idef).upper()
+                rarity_of[iid] = r
+                by_rarity.setdefault(r, []).append(iid)
+                display[iid] = self._get_item_display(idef)
+            self._items_src, self._item_rarity, self._items_by_rarity = catalog, rarity_of, by_rarity
+            self._item_display = display
+        return self._item_rarity, self._items_by_rarity
     # -------------------------------------------------------------------------------
 
+    def _reset_question_indices(self) -> None:
+        """(Re)build the unasked-question index lists; call if question_pool is replaced."""
+        preferred_tags = _preferred_tags_for(self._p_name)
+        pool = self.question_pool
+        self._remaining_idx = list(range(len(pool)))
+        self._preferred_idx = [
+            i for i, q in enumerate(pool)
+            if any(tag in q.tags for tag in preferred_tags)
+        ]
+
     def pick_question(self) -> Optional[Question]:
         if not self.question_pool:
             return None
-            
-        # Identify Target Tags based on Personality
-        preferred_tags = []
-        p_name = self.demon.personality.name if hasattr(self.demon.personality, "name") else str(self.demon.personality)
-        p_name = p_name.upper()
-        
-        if "IRRITABLE" in p_name: preferred_tags = ["AGGRESSIVE", "POWER", "DIRECT"]
-        elif "TIMID" in p_name: preferred_tags = ["GENTLE", "SCARED", "SAFETY"]
-        elif "UPBEAT" in p_name: preferred_tags = ["FUN", "SOCIAL", "HOBBY"]
-        elif "GLOOMY" in p_name: preferred_tags = ["DEATH", "SADNESS", "MEANING"]
-        elif "CUNNING" in p_name: preferred_tags = ["TRICK", "VALUE", "SMART"]
-        elif "PLAYFUL" in p_name: preferred_tags = ["FUN", "JOKE", "GAME"]
-        elif "PROUD" in p_name: preferred_tags = ["HONOR", "POWER", "RESPECT"]
-            
-        candidates = []
-        for q in self.question_pool:
-            if q.id in self._used_question_ids:
-                continue
-            if any(tag in q.tags for tag in preferred_tags):
-                candidates.append(q)
-        
-        if not candidates:
-            candidates = [q for q in self.question_pool if q.id not in self._used_question_ids]
-            
+
+        # Questions matching the personality first, then anything not yet asked
+        candidates = self._preferred_idx or self._remaining_idx
         if not candidates:
-            return None 
+            return None
 
-        selected = self.rng.choice(candidates)
-        self._used_question_ids.add(selected.id)
-        return selected
+        idx = candidates.pop(self.rng.randrange(len(candidates)))
+        if candidates is self._preferred_idx:
+            self._remaining_idx.remove(idx)
+        return self.question_pool[idx]
 
     def _get_demand_multiplier(self) -> float:
-        multipliers = { "COMMON": 1.0, "UNCOMMON": 1.5, "RARE": 3.0, "EPIC": 5.0, "LEGENDARY": 10.0 }
         r_name = self.demon.rarity.name if hasattr(self.demon.rarity, "name") else str(self.demon.rarity)
-        return multipliers.get(r_name.upper(), 1.0)
+        return _DEMAND_MULTIPLIERS.get(r_name.upper(), 1.0)
 
     def _resolve_text(self, content: Any) -> str:
         if isinstance(content, str): return content
         if isinstance(content, dict):
-            p_name = self.demon.personality.name if hasattr(self.demon.personality, "name") else str(self.demon.personality)
-            return content.get(p_name.upper(), content.get("DEFAULT", "..."))
+            return content.get(self._p_name, content.get("DEFAULT", "..."))
         return "..."
 
     def process_event(self, whim_trigger: Dict[str, Any], ask_yes_no: Callable, ask_pay: Callable, ask_give_item: Callable) -> EventResult:
@@ -137,24 +260,25 @@ class NegotiationSession:
                 r_name = self.demon.rarity.name if hasattr(self.demon.rarity, "name") else str(self.demon.rarity)
                 req_rarity = r_name
             
+            rarity_of, by_rarity = self._rarity_index()
             if req_rarity:
                 # Priority: Inventory -> Fallback: Catalog
-                owned_candidates = [inv_id for inv_id in self.player.inventory.keys() 
-                                    if self.items_catalog.get(inv_id) and self._is_item_rarity(self.items_catalog[inv_id], req_rarity)]
+                req = req_rarity.upper()
+                owned_candidates = [inv_id for inv_id in self.player.inventory
+                                    if rarity_of.get(inv_id) == req and self.items_catalog[inv_id]]
                 
                 if owned_candidates:
                     target_item_id = self.rng.choice(owned_candidates)
                 else:
-                    all_candidates = [cat_id for cat_id, cat_def in self.items_catalog.items() 
-                                      if self._is_item_rarity(cat_def, req_rarity)]
+                    all_candidates = by_rarity.get(req)
                     target_item_id = self.rng.choice(all_candidates) if all_candidates else "life_stone"
 
-            if target_item_id and target_item_id in self.items_catalog:
-                target_item_name = self._get_item_display(self.items_catalog[target_item_id])
+            if target_item_id:
+                target_item_name = self._item_display.get(target_item_id, target_item_name)
 
         raw_text = self._resolve_text(event_data.get("text", "..."))
         final_text = raw_text.replace("{item}", target_item_name)
-        print(f"\n[{self.demon.name}]: {final_text}")
+        self.log(f"\n[{self.demon.name}]: {final_text}")
 
         # HANDLERS
         if w_type == "ask_pay":
@@ -169,11 +293,12 @@ class NegotiationSession:
             return EventResult(False, msg_fail, event_data.get("penalty_rapport", -2), "ANGRY")
 
         elif w_type == "ask_item":
+            # target_item_id is a catalog/inventory key, i.e. already canonical
             qty = max(1, int(event_data.get("amount", 1)))
-            has_it = self.player.has_item(target_item_id, qty)
-            if ask_give_item(target_item_name, qty, self.player.inventory.get(target_item_id, 0)):
-                if has_it:
-                    self.player.remove_item(target_item_id, qty)
+            have = self.player.inventory.get(target_item_id, 0)
+            if ask_give_item(target_item_name, qty, have):
+                if have >= qty:
+                    self.player._remove_item_fast(target_item_id, qty)
                     d_rap = event_data.get("reward_rapport", 15)
                     self.rapport += d_rap
                     return EventResult(True, msg_success, d_rap, "HAPPY")
@@ -236,23 +361,27 @@ class NegotiationSession:
             return ReactionFeedback("NEUTRAL", "...", 0, 0, [], [], ["Invalid choice"])
 
         resp_text, effect = question.responses[choice_idx]
+        # Contract: load_questions hands us dict effects with int dLC/dLD/dRapport
+        if not isinstance(effect, dict):
+            raise ValueError(f"Question '{question.id}' choice '{resp_text}' has a non-dict effect.")
 
         # 1. State
         stance = self.player.stance_alignment
         demon_align = self.demon.alignment
-        dist_before = stance.manhattan_distance(demon_align)
+        dist_before = self.demon_distance
 
         # 2. Stance Shift
-        d_lc = int(effect.get("dLC", 0))
-        d_ld = int(effect.get("dLD", 0))
-        stance.law_chaos += d_lc
-        stance.light_dark += d_ld
-        stance.law_chaos = max(-10, min(10, stance.law_chaos))
-        stance.light_dark = max(-10, min(10, stance.light_dark))
+        d_lc = effect.get("dLC", 0)
+        d_ld = effect.get("dLD", 0)
+        lc = stance.law_chaos + d_lc
+        ld = stance.light_dark + d_ld
+        stance.law_chaos = 10 if lc > 10 else -10 if lc < -10 else lc
+        stance.light_dark = 10 if ld > 10 else -10 if ld < -10 else ld
+        self.invalidate_distance()
 
         # 3. SCORE CALCULATION (THE FIX)
         # Start with the base value from JSON (e.g., 10, 15)
-        d_rep = int(effect.get("dRapport", 0))
+        d_rep = effect.get("dRapport", 0)
         
         # A. Alignment Factor (Intention)
         if (demon_align.law_chaos < 0 and d_lc < 0) or (demon_align.law_chaos > 0 and d_lc > 0):
@@ -260,31 +389,28 @@ class NegotiationSession:
         if (demon_align.light_dark < 0 and d_ld < 0) or (demon_align.light_dark > 0 and d_ld > 0):
             d_rep += 3
             
-        # B. Personality Factor (Tags)
-        tags = ensure_list_of_str(effect.get("tags", []))
-        if question.tags: tags.extend(question.tags)
+        # B. Personality Factor (Tags, merged and upper-cased once by load_questions)
+        tags = question.tags_for(choice_idx)
         
-        liked, disliked = [], []
-        p_name = self.demon.personality.name if hasattr(self.demon.personality, "name") else str(self.demon.personality)
-        current_weights = personality_weights.get(p_name.upper(), personality_weights.get("DEFAULT", {}))
+        if personality_weights is not self._weights_src:
+            self._weights_src = personality_weights
+            self._weights = personality_weights.get(self._p_name, personality_weights.get("DEFAULT", {}))
+        current_weights = self._weights
 
-        for tag in tags:
-            weight = current_weights.get(tag.upper(), 0.0)
-            if weight != 0:
-                points = int(5 * weight)
-                d_rep += points
-                (liked if weight > 0 else disliked).append(tag)
+        bonus, liked, disliked = _tag_score(current_weights, tags)
+        d_rep += bonus
 
         # C. Variance
-        if self.rng: d_rep += self.rng.randint(-1, 2)
+        d_rep += self.rng.randint(-1, 2)
         
         # 4. Update
-        self.rapport = max(RAPPORT_MIN, min(RAPPORT_MAX, self.rapport + int(d_rep)))
+        r, lo, hi = self.rapport + d_rep, self._rapport_min, self._rapport_max
+        self.rapport = hi if r > hi else lo if r < lo else r
         self.turns_left -= 1
 
         # 5. Metrics
-        dist_after = stance.manhattan_distance(demon_align)
-        tone = tone_from_delta(int(d_rep))
+        dist_after = self.demon_distance
+        tone = tone_from_delta(d_rep)
         
         if tone == "ANGRY": self.current_tolerance -= 1
 
@@ -292,38 +418,57 @@ class NegotiationSession:
             cue = flavor_cue(self.demon.personality, tone, personality_cues, default="...")
         except Exception: cue = "…"
 
+        note = f"Total Score: {d_rep} (Base JSON: {effect.get('dRapport',0)})"
+        fb = self.last_feedback
+        if self.reuse_feedback and fb is not None:
+            fb.tone = tone
+            fb.cue = cue
+            fb.delta_rapport = d_rep
+            fb.delta_distance = dist_after - dist_before
+            fb.liked_tags[:] = liked
+            fb.disliked_tags[:] = disliked
+            fb.notes[:] = (note,)
+            return fb
+
         fb = ReactionFeedback(
-            tone=tone, cue=cue, delta_rapport=int(d_rep), 
-            delta_distance=int(dist_after - dist_before),
-            liked_tags=liked, disliked_tags=disliked, 
-            notes=[f"Total Score: {d_rep} (Base JSON: {effect.get('dRapport',0)})"]
+            tone=tone, cue=cue, delta_rapport=d_rep, 
+            delta_distance=dist_after - dist_before,
+            liked_tags=list(liked), disliked_tags=list(disliked), 
+            notes=[note]
         )
         self.last_feedback = fb  
         return fb
 
     def difficulty(self, level: int) -> None:
         drop = self.rng.randint(0, max(0, level // 2))
-        self.rapport = max(RAPPORT_MIN, self.rapport - drop)
+        r = self.rapport - drop
+        self.rapport = r if r > self._rapport_min else self._rapport_min
         if self.rng.random() < (level / 10.0):
-            axis = self.rng.choice(("law_chaos", "light_dark"))
-            s = getattr(self.player.stance_alignment, axis)
-            d = getattr(self.demon.alignment, axis)
-            if s < d: setattr(self.player.stance_alignment, axis, s - 1)
-            elif s > d: setattr(self.player.stance_alignment, axis, s + 1)
-            self.player.stance_alignment.clamp()
+            stance, target = self.player.stance_alignment, self.demon.alignment
+            # randrange(2) is the same draw choice() made over the two axis names
+            if self.rng.randrange(2) == 0:
+                s, d = stance.law_chaos, target.law_chaos
+                if s < d: stance.law_chaos = s - 1
+                elif s > d: stance.law_chaos = s + 1
+            else:
+                s, d = stance.light_dark, target.light_dark
+                if s < d: stance.light_dark = s - 1
+                elif s > d: stance.light_dark = s + 1
+            stance.clamp()
+            self.invalidate_distance()
 
     def check_union(self) -> None:
         if not self.in_progress: return
         
         # Stance Check (Optional: strict distance vs tolerance)
-        stance_ok = (self.player.stance_alignment.manhattan_distance(self.demon.alignment) <= 5)
+        stance_ok = (self.demon_distance <= 5)
         rapport_ok = (self.rapport >= self.demon.rapport_needed)
 
         if rapport_ok and stance_ok:
             if any(d.id == self.demon.id for d in self.player.roster):
                 self.in_progress = False
                 self.recruited = False 
-                print(f"\n[Info] {self.demon.name} ya está en tu equipo. Se marcha satisfecho.") 
+                self.log(f"\n[Info] {self.demon.name} ya está en tu equipo. Se marcha satisfecho.") 
                 self._give_duplicate_reward()
             else:
                 self.recruited = True
@@ -334,11 +479,11 @@ class NegotiationSession:
         if self.current_tolerance <= 0:
             self.in_progress = False
             self.turns_left = 0
-            print(f"\n[{self.demon.name}]: ¡Se acabó mi paciencia con tus estupideces! (Tolerancia agotada)")
+            self.log(f"\n[{self.demon.name}]: ¡Se acabó mi paciencia con tus estupideces! (Tolerancia agotada)")
         elif self.turns_left <= 0:
             self.in_progress = False
             self.fled = True 
-            print(f"\n[{self.demon.name}]: Me aburrí. Me largo.")
+            self.log(f"\n[{self.demon.name}]: Me aburrí. Me largo.")
 
     def attempt_bribe(self) -> str:
         multiplier = self._get_demand_multiplier()
@@ -348,11 +493,8 @@ class NegotiationSession:
         self.player.change_gold(-cost)
         base_chance = 0.30 + (self.rapport * 0.05)
         
-        p_str = str(self.demon.personality).upper()
-        p_mod = 0.20 if "CUNNING" in p_str else (0.10 if "IRRITABLE" in p_str else (-0.10 if "UPBEAT" in p_str else 0))
-        
-        r_str = str(self.demon.rarity).upper()
-        r_pen = 0.4 if "LEGENDARY" in r_str else (0.2 if "EPIC" in r_str else (0.1 if "RARE" in r_str else 0))
+        p_mod = _BRIBE_PERSONALITY_MOD.get(self._p_name, 0)
+        r_pen = _BRIBE_RARITY_PENALTY.get(self._get_item_rarity_name(self.demon).upper(), 0)
 
         if self.rng.random() < (base_chance + p_mod - r_pen):
             self.recruited = True
@@ -367,10 +509,7 @@ class NegotiationSession:
     def attempt_flee(self) -> str:
         self.fled = True
         self.in_progress = False
-        hit_chance = 0.3
-        p_str = str(self.demon.personality).upper()
-        if "IRRITABLE" in p_str: hit_chance = 0.8
-        elif "TIMID" in p_str: hit_chance = 0.1
+        hit_chance = _FLEE_HIT_CHANCE.get(self._p_name, 0.3)
         
         if self.rng.random() < hit_chance:
             self.player.change_hp(-15)
@@ -379,56 +518,58 @@ class NegotiationSession:
 
     def finish_union(self) -> None:
         self.player.relax_posture()
-        clear_screen()
-        print("\n" + "="*40 + "\n ¡NEGOCIACIÓN EXITOSA! \n" + "="*40)
+        self.invalidate_distance()
+        self.clear()
+        self.log("\n" + "="*40 + "\n ¡NEGOCIACIÓN EXITOSA! \n" + "="*40)
         xp = int(20 * self._get_demand_multiplier())
         
         if hasattr(self.player, "gain_exp"): lvl_up = self.player.gain_exp(xp)
         else: self.player.exp += xp; lvl_up = False
         
-        print(f"\n[Progreso] ¡Ganaste {xp} XP!")
-        if lvl_up: print(f"[!!!] ¡LEVEL UP! -> Nivel {self.player.lvl}")
+        self.log(f"\n[Progreso] ¡Ganaste {xp} XP!")
+        if lvl_up: self.log(f"[!!!] ¡LEVEL UP! -> Nivel {self.player.lvl}")
         
-        print(f"\n{self.demon.name}: 'Excelente, me uniré a tu equipo'")
+        self.log(f"\n{self.demon.name}: 'Excelente, me uniré a tu equipo'")
         self.player.roster.append(self.demon)
-        print(f"[Compendio] {self.demon.name} registrado.")
+        self.log(f"[Compendio] {self.demon.name} registrado.")
 
     def _give_duplicate_reward(self) -> None:
-        print(f"\n{self.demon.name}: 'Ya viajamos juntos. Toma esto.'")
+        self.log(f"\n{self.demon.name}: 'Ya viajamos juntos. Toma esto.'")
         if self.rng.random() < 0.5: self._give_macca_reward()
         else: self._give_item_reward()
 
     def _give_macca_reward(self):
-        ranges = {"COMMON": (10,50), "UNCOMMON": (50,150), "RARE": (150,400), "EPIC": (400,1000), "LEGENDARY": (1000,5000)}
         r_name = self._get_item_rarity_name(self.demon).upper()
-        amt = self.rng.randint(*ranges.get(r_name, (10,50)))
+        amt = self.rng.randint(*_MACCA_REWARD_RANGES.get(r_name, (10,50)))
         self.player.change_gold(amt)
-        print(f"[Recompensa] ¡{amt} Macca!")
+        self.log(f"[Recompensa] ¡{amt} Macca!")
 
     def _give_item_reward(self):
-        r_tiers = {"COMMON": 0, "UNCOMMON": 1, "RARE": 2, "EPIC": 3, "LEGENDARY": 4}
-        d_tier = r_tiers.get(self._get_item_rarity_name(self.demon).upper(), 0)
+        d_tier = _RARITY_TIERS.get(self._get_item_rarity_name(self.demon).upper(), 0)
         t_tier = self.rng.randint(0, d_tier)
         qty = 2 ** (d_tier - t_tier)
-        t_rarity = {v: k for k, v in r_tiers.items()}.get(t_tier, "COMMON")
+        t_rarity = _RARITY_BY_TIER[t_tier] if t_tier < len(_RARITY_BY_TIER) else "COMMON"
         
-        cands = [k for k, v in self.items_catalog.items() if self._is_item_rarity(v, t_rarity)]
-        if not cands: cands = [k for k, v in self.items_catalog.items() if self._is_item_rarity(v, "COMMON")]
+        by_rarity = self._rarity_index()[1]
+        cands = by_rarity.get(t_rarity) or by_rarity.get("COMMON")
         
         if cands:
             cid = self.rng.choice(cands)
-            self.player.add_item(cid, qty)
-            print(f"[Recompensa] {qty}x {self._get_item_display(self.items_catalog[cid])} ({t_rarity})!")
+            self.player._add_item_fast(cid, qty)
+            self.log(f"[Recompensa] {qty}x {self._get_item_display(self.items_catalog[cid])} ({t_rarity})!")
         else: self._give_macca_reward()
 
     def trigger_whim(self, whims_templates: List[dict], whim_config: Dict[str, Any]) -> Optional[str]:
         if not whims_templates: return None
-        base = float(whim_config.get("base_chance", 0.0))
-        p_name = self.demon.personality.name if hasattr(self.demon.personality, "name") else str(self.demon.personality)
-        mod = float(whim_config.get("personality_mod", {}).get(p_name.upper(), 0.0))
-        
-        if self.rng.random() > (base + mod): return None
-        return self.rng.choices(whims_templates, weights=[w.get("weight", 1) for w in whims_templates], k=1)[0].get("id")
+        if whim_config is not self._whim_cfg_src:
+            base = float(whim_config.get("base_chance", 0.0))
+            mod = float(whim_config.get("personality_mod", {}).get(self._p_name, 0.0))
+            self._whim_cfg_src, self._whim_chance = whim_config, base + mod
+
+        # Always draw, even at zero chance: skipping it would shift every later seeded roll
+        if self.rng.random() > self._whim_chance: return None
+        cum = _whim_cum_weights(whims_templates)
+        return self.rng.choices(whims_templates, cum_weights=cum, k=1)[0].get("id")
 
     def finish_fled(self) -> None:
         if self.fled: self.in_progress = False
\ No newline at end of file
@@ -1,8 +1,8 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Dict, List, Set, Any, Optional
-from drlite.utils import canonical_item_id
+from typing import Dict, List, Set, Any, Optional, Tuple
+from drlite.utils import canonical_item_id, normalize_weight_tags
 
 from drlite.config import AXIS_MIN, AXIS_MAX
 
@@ -44,8 +44,9 @@ class Alignment:
 
     def clamp(self) -> None:
         """ Adjusts the values to the ranges """
-        self.law_chaos  = max(AXIS_MIN, min(AXIS_MAX, self.law_chaos))
-        self.light_dark = max(AXIS_MIN, min(AXIS_MAX, self.light_dark))
+        lc, ld = self.law_chaos, self.light_dark
+        self.law_chaos  = AXIS_MIN if lc < AXIS_MIN else AXIS_MAX if lc > AXIS_MAX else lc
+        self.light_dark = AXIS_MIN if ld < AXIS_MIN else AXIS_MAX if ld > AXIS_MAX else ld
 
     def manhattan_distance(self, other: "Alignment") -> int:
         """ Compare with other alignments to make decisions """
@@ -58,7 +59,29 @@ class Question:
     text: str
     # Format: List[Tuple[ResponseText, StatsDict]]
     responses: List[Tuple[str, Dict[str, Any]]] 
-    tags: List[str] = field(default_factory=list)
+    tags: List[str] = field(default_factory=list)   # upper-cased at load
+    # Per-response inline event payload (or None), aligned with `responses`.
+    # Resolved once at load so consumers skip the isinstance/.get("event") dance.
+    events: List[Optional[Dict[str, Any]]] = field(default_factory=list)
+    # Per-response choice tags followed by question tags, built once at load
+    merged_tags: List[Tuple[str, ...]] = field(default_factory=list)
+
+    def event_for(self, idx: int) -> Optional[Dict[str, Any]]:
+        """Inline event attached to response `idx`, if any."""
+        if idx < len(self.events):
+            return self.events[idx]
+        stats = self.responses[idx][1]
+        evt = stats.get("event") if isinstance(stats, dict) else None
+        return evt if isinstance(evt, dict) else None
+
+    def tags_for(self, idx: int) -> Tuple[str, ...]:
+        """Choice tags + question tags for response `idx` (upper-cased, as weights are keyed)."""
+        if idx < len(self.merged_tags):
+            return self.merged_tags[idx]
+        # Hand-built Question: normalize here the way load_questions does
+        stats = self.responses[idx][1]
+        choice_tags = normalize_weight_tags(stats.get("tags")) if isinstance(stats, dict) else []
+        return tuple(choice_tags) + tuple(normalize_weight_tags(self.tags))
 
 @dataclass(slots=True)
 class ReactionFeedback:
@@ -87,6 +110,8 @@ class Demon:
     rapport_needed: int
     sprite_source: str = "" 
     sprite_key: str = ""
+    # World availability (restored from saves); declared so it always exists
+    available: bool = True
 
 
 @dataclass(slots=True, eq=False)
@@ -118,26 +143,26 @@ class Player:
 
     def relax_posture(self, step: int = 1):
         """
-        Move stance 1 step per axis toward core, then clamp.
+        Move stance up to `step` per axis toward core (never past it).
+        No AXIS_MIN/MAX clamp: the stance may sit in process_answer's wider ±10 range.
         """
-        cx, cy = self.core_alignment.law_chaos, self.core_alignment.light_dark
-        sx, sy = self.stance_alignment.law_chaos, self.stance_alignment.light_dark
+        core, stance = self.core_alignment, self.stance_alignment
 
-        if sx < cx: sx += 1
-        elif sx > cx: sx -= 1
-        
-        if sy < cy: sy += 1
-        elif sy > cy: sy -= 1
-        
-        self.stance_alignment.law_chaos = sx
-        self.stance_alignment.light_dark = sy
+        # Branchless per axis: sign(diff) * min(step, |diff|)
+        diff = core.law_chaos - stance.law_chaos
+        mag = diff if diff >= 0 else -diff
+        stance.law_chaos += ((diff > 0) - (diff < 0)) * (step if step < mag else mag)
+
+        diff = core.light_dark - stance.light_dark
+        mag = diff if diff >= 0 else -diff
+        stance.light_dark += ((diff > 0) - (diff < 0)) * (step if step < mag else mag)
 
     def add_item(self, name: str, qty: int = 1) -> None:
         """Add items to the inventory using canonical IDs."""
         iid = canonical_item_id(name)
         if not iid:
             return
-        self.inventory[iid] = self.inventory.get(iid, 0) + max(0, int(qty))
+        self._add_item_fast(iid, max(0, int(qty)))
 
     def has_item(self, name: str, qty: int = 1) -> bool:
         """Check if the player has at least `qty` of the item."""
@@ -146,16 +171,24 @@ class Player:
 
     def remove_item(self, name: str, qty: int = 1) -> bool:
         """Consume items if available; return True if removed."""
-        iid = canonical_item_id(name)
-        need = max(1, int(qty))
-        have = self.inventory.get(iid, 0)
-        if have < need:
+        return self._remove_item_fast(canonical_item_id(name), max(1, int(qty)))
+
+    # --- Fast paths: `iid` must already be canonical (catalog/inventory keys) ---
+    def _add_item_fast(self, iid: str, qty: int) -> None:
+        assert iid == canonical_item_id(iid), iid
+        inv = self.inventory
+        inv[iid] = inv.get(iid, 0) + qty
+
+    def _remove_item_fast(self, iid: str, qty: int) -> bool:
+        assert iid == canonical_item_id(iid), iid
+        inv = self.inventory
+        have = inv.get(iid, 0)
+        if have < qty:
             return False
-        newq = have - need
-        if newq > 0:
-            self.inventory[iid] = newq
+        if have > qty:
+            inv[iid] = have - qty
         else:
-            self.inventory.pop(iid, None)
+            del inv[iid]
         return True
 
     def count_item(self, item_id: str) -> int:
@@ -247,8 +280,8 @@ class Player:
         Attempts to use an item. 
         Returns (Success, Feedback Message).
         """
-        # 1. Check possession
-        if not self.has_item(item_id, 1):
+        # 1. Check possession (item_id comes from inventory keys: already canonical)
+        if self.inventory.get(item_id, 0) < 1:
             return False, "You don't have that item."
 
         # 2. Apply Effect
@@ -288,7 +321,7 @@ class Player:
 
         # 3. Consume
         if used and item_def.consumable:
-            self.remove_item(item_id, 1)
+            self._remove_item_fast(item_id, 1)
 
         return used, msg
 
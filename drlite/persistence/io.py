@@ -1,9 +1,15 @@
 import json
 import os
+import sys
 from enum import Enum
 from typing import Any, Dict, Optional, List, Tuple
 from dataclasses import asdict, is_dataclass
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
 from drlite.models import Player, Alignment, Demon, Personality, Rarity
+from drlite.utils import json_loads, json_dumps_pretty, read_bytes
 
 # ==============================================================================
 #  Robust JSON Encoder
@@ -37,6 +43,28 @@ class DRLiteEncoder(json.JSONEncoder):
 #  Atomic I/O System (Safe Save)
 # ==============================================================================
 
+# Player stats and the value load_game assumes when a save omits them.
+# save_game skips stats equal to these, so both sides must share this table.
+_PLAYER_SAVE_DEFAULTS: Dict[str, int] = {
+    "lvl": 1, "exp": 0, "exp_next": 100,
+    "hp": 50, "max_hp": 50, "mp": 20, "max_mp": 20,
+    "gold": 0,
+}
+
+# 2: alignments stored as [law_chaos, light_dark] lists (v1 used dicts; still readable)
+SAVE_VERSION = 2
+
+def _alignment_to_save(a: Alignment) -> List[int]:
+    return [a.law_chaos, a.light_dark]
+
+def _alignment_from_save(val: Any) -> Alignment:
+    """Accepts the v2 [lc, ld] pair or the v1 {"law_chaos", "light_dark"} dict."""
+    if isinstance(val, dict):
+        return Alignment(int(val.get("law_chaos", 0)), int(val.get("light_dark", 0)))
+    if isinstance(val, (list, tuple)) and len(val) >= 2:
+        return Alignment(int(val[0]), int(val[1]))
+    return Alignment(0, 0)
+
 def get_save_path(user_id: str) -> str:
     """Returns the absolute path for the save file."""
     # Ensure directory exists
@@ -44,6 +72,62 @@ def get_save_path(user_id: str) -> str:
     os.makedirs(folder, exist_ok=True)
     return os.path.join(folder, f"{user_id}.json")
 
+def _fsync_dir(folder: str) -> None:
+    """Persist a rename by syncing its directory entry (POSIX only)."""
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    dfd = os.open(folder or ".", os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(dfd)
+    finally:
+        os.close(dfd)
+
+def _target_mode(path: str) -> int:
+    """Permission bits the save should end up with: the old file's, else 0o666 minus umask."""
+    try:
+        return os.stat(path).st_mode & 0o7777
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+def _atomic_write_bytes(path: str, payload: bytes) -> None:
+    """
+    Write `payload` to a temp file next to `path`, fsync it and rename it over
+    `path`, so a crash leaves either the old save or the new one, never a partial file.
+    """
+    import tempfile  # only needed when saving; kept off the import path
+
+    folder = os.path.dirname(path)
+    fd, tmp = tempfile.mkstemp(prefix=".tmp-", suffix=".json", dir=folder or ".")
+    try:
+        try:
+            # Unbuffered: the payload is already one bytes object
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view):]
+            # mkstemp creates the file 0600; keep the mode a plain open() would give
+            if hasattr(os, "fchmod"):
+                os.fchmod(fd, _target_mode(path))
+            try:
+                # macOS: plain fsync does not flush the drive cache
+                fcntl.fcntl(fd, fcntl.F_FULLFSYNC)
+            except (AttributeError, OSError):
+                os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+    try:
+        _fsync_dir(folder)
+    except OSError:
+        pass  # The save already landed; only its durability is best-effort
+
 def save_game(user_id: str, player: Player, demons_catalog: list, session=None):
     """
     Saves the player state to JSON.
@@ -53,39 +137,31 @@ def save_game(user_id: str, player: Player, demons_catalog: list, session=None):
     # 1. Serialize Roster (Save IDs only)
     roster_ids = [d.id for d in player.roster]
 
-    # 2. Serialize Alignments
-    core_align = {
-        "law_chaos": player.core_alignment.law_chaos,
-        "light_dark": player.core_alignment.light_dark
-    }
-    stance_align = {
-        "law_chaos": player.stance_alignment.law_chaos,
-        "light_dark": player.stance_alignment.light_dark
-    }
+    # 2. Serialize Alignments (flat [law_chaos, light_dark] pairs)
+    core_align = _alignment_to_save(player.core_alignment)
+    stance_align = _alignment_to_save(player.stance_alignment)
+
+    # 3. Data Structure (stats at their load default and empty collections are omitted)
+    p_out = {"name": player.name}
+    for key, default in _PLAYER_SAVE_DEFAULTS.items():
+        val = getattr(player, key)
+        if val != default:
+            p_out[key] = val
+    if player.inventory:
+        p_out["inventory"] = player.inventory # Dict {id: qty} is serializable
+    p_out["core_alignment"] = core_align
+    p_out["stance_alignment"] = stance_align
+    if roster_ids:
+        p_out["roster"] = roster_ids
 
-    # 3. Data Structure
     data = {
+        "version": SAVE_VERSION,
         "user_id": user_id,
-        "player": {
-            "name": player.name,
-            "lvl": player.lvl,
-            "exp": player.exp,
-            "exp_next": player.exp_next,
-            "hp": player.hp,
-            "max_hp": player.max_hp,
-            "mp": player.mp,
-            "max_mp": player.max_mp,
-            "gold": player.gold,
-            "inventory": player.inventory, # Dict {id: qty} is serializable
-            "core_alignment": core_align,
-            "stance_alignment": stance_align,
-            "roster": roster_ids
-        }
+        "player": p_out
     }
 
     try:
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+        _atomic_write_bytes(path, json_dumps_pretty(data))
         
         # DEBUG: Imprimimos la ruta absoluta para que sepas dónde está
         abs_path = os.path.abspath(path)
@@ -105,8 +181,7 @@ def load_game(user_id: str, demons_catalog: List[Demon]) -> Tuple[Player, List[D
         return Player(name=user_id), demons_catalog
 
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = json_loads(read_bytes(path))
         
         p_data = data["player"]
         
@@ -114,34 +189,33 @@ def load_game(user_id: str, demons_catalog: List[Demon]) -> Tuple[Player, List[D
         c_al = p_data.get("core_alignment", {})
         s_al = p_data.get("stance_alignment", {})
         
-        core_obj = Alignment(c_al.get("law_chaos", 0), c_al.get("light_dark", 0))
-        stance_obj = Alignment(s_al.get("law_chaos", 0), s_al.get("light_dark", 0))
+        core_obj = _alignment_from_save(c_al)
+        stance_obj = _alignment_from_save(s_al)
 
         # 2. Reconstruct Roster (ID -> Demon Object)
         roster_objs = []
         saved_ids = p_data.get("roster", [])
         
-        # Map catalog for speed
+        # Map catalog for speed (ids are unique: load_demons skips duplicates)
         catalog_map = {d.id: d for d in demons_catalog}
+        seen_ids = set() # Roster holds each demon once (check_union enforces it)
         
         for d_id in saved_ids:
-            if d_id in catalog_map:
+            if d_id in seen_ids:
+                continue
+            d = catalog_map.get(d_id)
+            if d is not None:
                 # IMPORTANT: In a real game, you might clone this object 
                 # to track individual HP/MP. For Lite, reference is fine.
-                roster_objs.append(catalog_map[d_id])
+                roster_objs.append(d)
+                seen_ids.add(d_id)
         
         # 3. Create Player
         player = Player(
             name=p_data.get("name", user_id),
-            lvl=p_data.get("lvl", 1),
-            exp=p_data.get("exp", 0),
-            exp_next=p_data.get("exp_next", 100),
-            hp=p_data.get("hp", 50),
-            max_hp=p_data.get("max_hp", 50),
-            mp=p_data.get("mp", 20),
-            max_mp=p_data.get("max_mp", 20),
-            gold=p_data.get("gold", 0),
-            inventory=p_data.get("inventory", {}),
+            **{key: p_data.get(key, default) for key, default in _PLAYER_SAVE_DEFAULTS.items()},
+            # Share key objects with the (interned) catalog ids
+            inventory={sys.intern(k): v for k, v in p_data.get("inventory", {}).items()},
             roster=roster_objs,
             core_alignment=core_obj,
             stance_alignment=stance_obj
@@ -173,9 +247,10 @@ def rehydrate_game_state(raw_data: Dict[str, Any], player_class: Any, demons_cat
     world_avail = raw_data.get("world_availability", {})
     if world_avail:
         for demon in demons_catalog:
-            # Keys in JSON are always strings
-            if demon.id in world_avail:
-                demon.available = world_avail[demon.id]
+            # Keys in JSON are always strings; Demon always declares `available`
+            avail = world_avail.get(demon.id)
+            if avail is not None:
+                demon.available = avail
 
     # 2. Reconstruct Player
     p_data = raw_data.get("player", {})
@@ -187,44 +262,40 @@ def rehydrate_game_state(raw_data: Dict[str, Any], player_class: Any, demons_cat
     # Restore and Sanitize Inventory
     # Ensure keys are strings and values are ints > 0
     raw_inv = p_data.get("inventory", {})
-    clean_inv = {}
-    for k, v in raw_inv.items():
-        try:
-            qty = int(v)
-            if qty > 0:
-                clean_inv[str(k)] = qty
-        except (ValueError, TypeError):
-            continue
+    if all(type(k) is str and type(v) is int and v > 0 for k, v in raw_inv.items()):
+        # Common case (our own saves): already clean, just copy
+        clean_inv = dict(raw_inv)
+    else:
+        clean_inv = {}
+        for k, v in raw_inv.items():
+            try:
+                qty = int(v)
+                if qty > 0:
+                    clean_inv[str(k)] = qty
+            except (ValueError, TypeError):
+                continue
     player.inventory = clean_inv
 
     # 3. Reconstruct Alignment (Defensive)
     # Helper to handle legacy formats (list) vs new formats (dict)
-    def _extract_align(source, key):
-        val = source.get(key)
-        if isinstance(val, dict):
-            return int(val.get("law_chaos", 0)), int(val.get("light_dark", 0))
-        # Fallback for old saves if any
-        if isinstance(val, (list, tuple)) and len(val) >= 2:
-            return int(val[0]), int(val[1])
-        return 0, 0
-
     # Core Alignment
-    lc, ld = _extract_align(p_data, "core")
+    core = _alignment_from_save(p_data.get("core"))
     if hasattr(player, "core_alignment"):
-        player.core_alignment.law_chaos = lc
-        player.core_alignment.light_dark = ld
+        player.core_alignment.law_chaos = core.law_chaos
+        player.core_alignment.light_dark = core.light_dark
 
     # Stance Alignment
-    lc, ld = _extract_align(p_data, "stance")
+    stance = _alignment_from_save(p_data.get("stance"))
     if hasattr(player, "stance_alignment"):
-        player.stance_alignment.law_chaos = lc
-        player.stance_alignment.light_dark = ld
+        player.stance_alignment.law_chaos = stance.law_chaos
+        player.stance_alignment.light_dark = stance.light_dark
         
     # 4. Reconstruct Roster (CRITICAL: Map IDs to Real Objects)
     raw_roster = p_data.get("roster", [])
     player.roster = []
     
     loaded_ids = set() # Track to avoid duplicates
+    catalog_map = {d.id: d for d in demons_catalog}
     
     for entry in raw_roster:
         # entry might be the serialized dict or just the ID string
@@ -235,7 +306,7 @@ def rehydrate_game_state(raw_data: Dict[str, Any], player_class: Any, demons_cat
             
         # Find the REAL object in the memory catalog
         # We do not create new Demon objects; we reference existing ones.
-        found = next((d for d in demons_catalog if d.id == d_id), None)
+        found = catalog_map.get(d_id)
         
         if found:
             player.roster.append(found)
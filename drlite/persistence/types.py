@@ -1,11 +1,11 @@
 from typing import TypedDict, Dict, List, Optional
 
 
-class SaveAlignment(TypedDict):
-    lc: int
-    ld: int
+# [law_chaos, light_dark]
+SaveAlignment = List[int]
 
-class SavePlayer(TypedDict):
+# total=False: save_game omits stats at their _PLAYER_SAVE_DEFAULTS value and empty collections
+class SavePlayer(TypedDict, total=False):
     core: SaveAlignment
     stance: SaveAlignment
     gold: int
@@ -1,5 +1,6 @@
 import os
 import sys
+from functools import lru_cache
 from typing import Optional, List
 from drlite.models import Player, Demon, Rarity, Alignment
 
@@ -7,6 +8,13 @@ from drlite.models import Player, Demon, Rarity, Alignment
 #  CONSTANTS & STYLING
 # ==============================================================================
 
+# Invalid answers tolerated before a prompt falls back to its safe default
+MAX_PROMPT_RETRIES = 8
+
+# Accepted answers for ask_yes_no
+_YES_ANSWERS = frozenset({"s", "si", "sí", "y", "yes"})
+_NO_ANSWERS = frozenset({"n", "no"})
+
 COLORS = {
     "RESET": "\033[0m",
     "BOLD": "\033[1m",
@@ -20,23 +28,32 @@ COLORS = {
     "GREY": "\033[90m"
 }
 
+_RESET = COLORS["RESET"]
+
 def _style(text: str, color_key: str) -> str:
     """Applies ANSI color code to text."""
-    code = COLORS.get(color_key.upper(), "")
-    return f"{code}{text}{COLORS['RESET']}"
+    # Callers pass upper-case keys; only fall back to .upper() for the odd one that doesn't
+    code = COLORS.get(color_key)
+    if code is None:
+        code = COLORS.get(color_key.upper(), "")
+    return f"{code}{text}{_RESET}"
+
+# Rarity name -> translated, colorized label (formatted once at import)
+_RARITY_LABELS = {
+    name: _style(label, color) for name, label, color in (
+        ("COMMON", "COMÚN", "WHITE"),
+        ("UNCOMMON", "POCO COMÚN", "GREEN"),
+        ("RARE", "RARO", "BLUE"),
+        ("EPIC", "ÉPICO", "MAGENTA"),
+        ("LEGENDARY", "LEGENDARIO", "YELLOW"),
+    )
+}
 
 def _rarity_label(rarity: Rarity) -> str:
     """Returns a colored string for the rarity."""
     # Handle both Enum object and string cases for safety
     r_name = rarity.name if hasattr(rarity, 'name') else str(rarity)
-    
-    # Translate and Colorize
-    if r_name == "COMMON": return _style("COMÚN", "WHITE")
-    if r_name == "UNCOMMON": return _style("POCO COMÚN", "GREEN")
-    if r_name == "RARE": return _style("RARO", "BLUE")
-    if r_name == "EPIC": return _style("ÉPICO", "MAGENTA")
-    if r_name == "LEGENDARY": return _style("LEGENDARIO", "YELLOW")
-    return r_name
+    return _RARITY_LABELS.get(r_name, r_name)
 
 # ==============================================================================
 #  SYSTEM UTILS
@@ -51,9 +68,14 @@ def wait_enter(prompt: str = "(Presiona Enter para continuar)"):
     print(f"\n{_style(prompt, 'GREY')}")
     input()
 
+@lru_cache(maxsize=16)
+def format_separator(char: str = "-", length: int = 60) -> str:
+    """Styled horizontal line (with trailing newline). Memoized: only a few (char, length) pairs exist."""
+    return _style(char * length, "GREY") + "\n"
+
 def print_separator(char: str = "-", length: int = 60):
     """Prints a styled horizontal line."""
-    print(_style(char * length, "GREY"))
+    sys.stdout.write(format_separator(char, length))
 
 # ==============================================================================
 #  BANNERS & INPUTS
@@ -74,32 +96,39 @@ def print_banner():
     print(_style(logo, "RED"))
     print_separator()
 
+# Difficulty prompt and answers, built once
+_DIFFICULTY_TEXT = (
+    f"\n{_style('SELECCIONA DIFICULTAD:', 'BOLD')}\n"
+    "1. Normal (Experiencia estándar)\n"
+    "2. Difícil (Menos turnos, personalidades estrictas)\n"
+)
+_DIFFICULTY_BY_CHOICE = {"1": "NORMAL", "2": "HARD"}
+_INVALID_OPTION_TEXT = _style("Opción no válida.", "RED") + "\n"
+
 def read_difficulty() -> str:
-    """Reads initial difficulty setting (User-facing in Spanish)."""
-    while True:
-        print(f"\n{_style('SELECCIONA DIFICULTAD:', 'BOLD')}")
-        print("1. Normal (Experiencia estándar)")
-        print("2. Difícil (Menos turnos, personalidades estrictas)")
-        choice = input("> ").strip()
-        
-        if choice == "1": return "NORMAL"
-        if choice == "2": return "HARD"
-        print(_style("Opción no válida.", "RED"))
+    """Reads initial difficulty setting (User-facing in Spanish). Defaults to NORMAL."""
+    for _ in range(MAX_PROMPT_RETRIES):
+        sys.stdout.write(_DIFFICULTY_TEXT)
+        difficulty = _DIFFICULTY_BY_CHOICE.get(input("> ").strip())
+        if difficulty is not None: return difficulty
+        sys.stdout.write(_INVALID_OPTION_TEXT)
+    return "NORMAL"
 
 def ask_yes_no(prompt: str) -> bool:
-    """Generic Yes/No prompt in Spanish (s/n)."""
-    while True:
+    """Generic Yes/No prompt in Spanish (s/n). Repeated invalid input counts as 'no'."""
+    for _ in range(MAX_PROMPT_RETRIES):
         # Prompt: "Pregunta (s/n) > "
         choice = input(f"{prompt} (s/n) > ").lower().strip()
-        if choice in ['s', 'si', 'sí', 'y', 'yes']: return True
-        if choice in ['n', 'no']: return False
+        if choice in _YES_ANSWERS: return True
+        if choice in _NO_ANSWERS: return False
+    return False
 
 def ask_selection(options: List[str], prompt: str = "Selecciona opción") -> int:
     """
     Generic menu selection. Returns the index (0-based) of the choice.
-    Returns -1 if cancel/back (if '0' is entered).
+    Returns -1 if cancel/back (if '0' is entered) or after too many invalid answers.
     """
-    while True:
+    for _ in range(MAX_PROMPT_RETRIES):
         try:
             choice = input(f"\n{prompt} > ").strip()
             if choice == '0': return -1
@@ -108,29 +137,38 @@ def ask_selection(options: List[str], prompt: str = "Selecciona opción") -> int
                 return idx
         except ValueError:
             pass
+    return -1
 
 # ==============================================================================
 #  CARDS & HUD
 # ==============================================================================
 
-def print_dex_card(demon: Demon):
+def format_dex_card(demon: Demon) -> str:
     """
-    Displays a detailed card for a demon (Used in Compendium).
+    Detailed card for a demon (Used in Compendium), as a single string.
     """
-    print_separator("=")
     r_lbl = _rarity_label(demon.rarity)
     p_lbl = _style(demon.personality.name, "CYAN")
     
-    print(f" {demon.name.upper()}".ljust(40) + f"[{r_lbl}]")
-    print(f" Personalidad: {p_lbl}")
-    print_separator("-")
-    print(f" Afinidad Necesaria: {demon.rapport_needed}")
-    # Placeholder for future lore/stats
-    print_separator("=")
+    return "".join((
+        format_separator("="),
+        f" {demon.name.upper()}".ljust(40) + f"[{r_lbl}]\n",
+        f" Personalidad: {p_lbl}\n",
+        format_separator("-"),
+        f" Afinidad Necesaria: {demon.rapport_needed}\n",
+        # Placeholder for future lore/stats
+        format_separator("="),
+    ))
 
-def print_header(player: Player, demon: Optional[Demon] = None, round_no: int = 0, max_rounds: int = 0):
+def print_dex_card(demon: Demon):
     """
-    Main HUD (Heads Up Display).
+    Displays a detailed card for a demon (Used in Compendium).
+    """
+    sys.stdout.write(format_dex_card(demon))
+
+def format_header(player: Player, demon: Optional[Demon] = None, round_no: int = 0, max_rounds: int = 0) -> str:
+    """
+    Main HUD (Heads Up Display) as a single string.
     """
     # 1. Turn Info
     if max_rounds > 0:
@@ -139,9 +177,10 @@ def print_header(player: Player, demon: Optional[Demon] = None, round_no: int =
         turn_str = "PREPARACIÓN"
 
     # 2. Player Stats
-    print_separator()
+    sep = format_separator()
+    out = [sep]
     name_txt = _style(f"{player.name} [Nv.{player.lvl}]", "BOLD")
-    print(f" {name_txt}".ljust(40) + turn_str.rjust(30))
+    out.append(f" {name_txt}".ljust(40) + turn_str.rjust(30) + "\n")
     
     # Color code HP (Red if critical < 30%)
     hp_color = "RED" if player.hp < player.max_hp * 0.3 else "GREEN"
@@ -151,24 +190,33 @@ def print_header(player: Player, demon: Optional[Demon] = None, round_no: int =
     mp_txt = _style(f"MP: {player.mp}/{player.max_mp}", mp_color)
     gold_txt = _style(f"Macca: {player.gold}", "YELLOW")
     
-    print(f" {hp_txt}  |  {mp_txt}  |  {gold_txt}")
+    out.append(f" {hp_txt}  |  {mp_txt}  |  {gold_txt}\n")
     
     # XP Bar visualization (Optional but nice)
     if player.exp_next > 0:
         pct = int((player.exp / player.exp_next) * 100)
-        print(f" EXP: {pct}%".rjust(60))
+        out.append(f" EXP: {pct}%".rjust(60) + "\n")
         
-    print_separator()
+    out.append(sep)
     
     # 3. Demon Info (Target)
     if demon:
         r_lbl = _rarity_label(demon.rarity)
-        print(f" VS  {_style(demon.name, 'RED')} ({r_lbl})".center(70))
-        print_separator()
+        out.append(f" VS  {_style(demon.name, 'RED')} ({r_lbl})".center(70) + "\n")
+        out.append(sep)
+    return "".join(out)
 
-def print_rapport_bar(current: int, needed: int, length: int = 20):
+def print_header(player: Player, demon: Optional[Demon] = None, round_no: int = 0, max_rounds: int = 0):
     """
-    Visual bar for negotiation progress.
+    Main HUD (Heads Up Display).
+    """
+    sys.stdout.write(format_header(player, demon, round_no, max_rounds))
+
+@lru_cache(maxsize=64)
+def format_rapport_bar(current: int, needed: int, length: int = 20) -> str:
+    """
+    Visual bar for negotiation progress, as a single string.
+    Memoized: only a handful of (current, needed) pairs occur per negotiation.
     """
     if needed <= 0: needed = 1
     ratio = max(0.0, min(1.0, current / needed))
@@ -191,5 +239,10 @@ def print_rapport_bar(current: int, needed: int, length: int = 20):
     bar_chars = "█" * filled + "░" * (length - filled)
     bar_colored = _style(bar_chars, color)
     
-    print(f" AFINIDAD: [{bar_colored}] {current}/{needed} ({status})")
-    print_separator()
\ No newline at end of file
+    return f" AFINIDAD: [{bar_colored}] {current}/{needed} ({status})\n" + format_separator()
+
+def print_rapport_bar(current: int, needed: int, length: int = 20):
+    """
+    Visual bar for negotiation progress.
+    """
+    sys.stdout.write(format_rapport_bar(current, needed, length))
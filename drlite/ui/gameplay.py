@@ -1,6 +1,9 @@
 from __future__ import annotations
-from typing import List, Dict, Any
+import sys
+import time
+from typing import Any, Callable, Dict, List
 
+from drlite import config
 from drlite.models import Demon, ItemEffect
 from drlite.engine.session import NegotiationSession
 from drlite.persistence.io import save_game
@@ -8,21 +11,71 @@ from drlite.persistence.io import save_game
 # Import tools from console.py
 from drlite.ui.console import (
     clear_screen, 
+    format_header,
+    format_rapport_bar,
     print_header, 
     print_rapport_bar, 
     print_dex_card, 
     wait_enter,
     ask_yes_no,
+    MAX_PROMPT_RETRIES,
     _style, 
     print_separator
 )
 
+def _noop() -> None:
+    return None
+
+def _option_index(raw: str) -> int:
+    """Single-digit menu answer -> int (0 when not a single digit)."""
+    if len(raw) != 1: return 0
+    idx = ord(raw) - 48
+    return idx if 0 <= idx <= 9 else 0
+
+_ACTION_MENU_TEXT = (
+    f"\n{_style('[ ACCIONES ]', 'BOLD')}\n"
+    " 1. HABLAR\n"
+    " 2. OBJETO\n"
+    " 3. SOBORNAR\n"
+    " 4. HUIR\n"
+)
+
+_LOBBY_MENU_TEXT = (
+    "\n[ FASE DE PREPARACIÓN ]\n"
+    " 1. LUCHAR (Iniciar Negociación)\n"
+    " 2. INVENTARIO\n"
+    " 3. COMPENDIO\n"
+    " 4. AYUDA\n"
+)
+
+_HELP_TEXT = (
+    f"{_style('--- AYUDA ---', 'BOLD')}\n"
+    "1. HABLAR: Elige respuestas que coincidan con la personalidad del Demonio.\n"
+    "2. OBJETO: Usa objetos para curar HP/MP.\n"
+    "3. SOBORNAR: Paga Macca para saltar la charla. (Chance depende de Rareza).\n"
+    "4. HUIR: Escapa del combate (Puedes recibir daño).\n"
+)
+
+def render_turn(session: NegotiationSession, with_menu: bool = True) -> str:
+    """
+    One round's screen (HUD + affinity bar + action menu) as a single string,
+    so the CLI issues one write and a bot frontend can send one message.
+    """
+    parts = [
+        format_header(session.player, session.demon, session.round_no, session.max_rounds),
+        format_rapport_bar(session.rapport, session.demon.rapport_needed),
+    ]
+    if with_menu:
+        parts.append(_ACTION_MENU_TEXT)
+    return "".join(parts)
+
 # ==============================================================================
 #  MENUS (Spanish Text)
 # ==============================================================================
 
 def menu_inventory(session: NegotiationSession) -> None:
     """Displays inventory and handles item usage."""
+    invalid = 0 # consecutive unusable answers; too many counts as "Volver"
     while True:
         clear_screen()
         print_header(session.player, session.demon)
@@ -59,22 +112,27 @@ def menu_inventory(session: NegotiationSession) -> None:
 
         try:
             idx = int(choice) - 1
-            if 0 <= idx < len(item_list):
-                item_id, item_def = item_list[idx]
-                
-                if not item_def.consumable or item_def.effect_type == ItemEffect.NONE:
-                    print(f"\n[Sistema] No puedes usar este objeto ahora.")
-                    wait_enter()
-                else:
-                    used, msg = session.player.use_item(item_id, item_def)
-                    color = "GREEN" if used else "RED"
-                    print(f"\n[Sistema] {_style(msg, color)}")
-                    wait_enter()
         except ValueError:
-            pass
+            idx = -1
+        if not 0 <= idx < len(item_list):
+            invalid += 1
+            if invalid >= MAX_PROMPT_RETRIES: return
+            continue
+        invalid = 0
+
+        item_id, item_def = item_list[idx]
+        if not item_def.consumable or item_def.effect_type == ItemEffect.NONE:
+            print(f"\n[Sistema] No puedes usar este objeto ahora.")
+            wait_enter()
+        else:
+            used, msg = session.player.use_item(item_id, item_def)
+            color = "GREEN" if used else "RED"
+            print(f"\n[Sistema] {_style(msg, color)}")
+            wait_enter()
 
 def menu_roster(session: NegotiationSession) -> None:
     """Displays Compendium."""
+    invalid = 0 # consecutive unusable answers; too many counts as "Volver"
     while True:
         clear_screen()
         print(f"\n{_style('--- COMPENDIO DE DEMONIOS ---', 'BOLD')}\n")
@@ -95,30 +153,39 @@ def menu_roster(session: NegotiationSession) -> None:
         
         try:
             idx = int(choice) - 1
-            if 0 <= idx < len(session.player.roster):
-                # Show the Card
-                clear_screen()
-                selected_demon = session.player.roster[idx]
-                print_dex_card(selected_demon)
-                wait_enter()
         except ValueError:
-            pass
+            idx = -1
+        if not 0 <= idx < len(session.player.roster):
+            invalid += 1
+            if invalid >= MAX_PROMPT_RETRIES: return
+            continue
+        invalid = 0
+
+        # Show the Card
+        clear_screen()
+        selected_demon = session.player.roster[idx]
+        print_dex_card(selected_demon)
+        wait_enter()
 
 def menu_help() -> None:
     clear_screen()
-    print(_style("--- AYUDA ---", "BOLD"))
-    print("1. HABLAR: Elige respuestas que coincidan con la personalidad del Demonio.")
-    print("2. OBJETO: Usa objetos para curar HP/MP.")
-    print("3. SOBORNAR: Paga Macca para saltar la charla. (Chance depende de Rareza).")
-    print("4. HUIR: Escapa del combate (Puedes recibir daño).")
+    sys.stdout.write(_HELP_TEXT)
     wait_enter()
 
+# Lobby option -> submenu (option 1 starts the negotiation)
+_LOBBY_MENUS: Dict[int, Callable[[NegotiationSession], None]] = {
+    2: menu_inventory,
+    3: menu_roster,
+    4: lambda session: menu_help(),
+}
+
 # ==============================================================================
 #  GAME FLOW
 # ==============================================================================
 
 def run_pre_negotiation(session: NegotiationSession) -> bool:
-    """Lobby Phase."""
+    """Lobby Phase. False when the player never picks a valid option (leave)."""
+    invalid = 0
     while True:
         clear_screen()
         print_separator("=")
@@ -127,17 +194,93 @@ def run_pre_negotiation(session: NegotiationSession) -> bool:
         
         print_header(session.player, None)
         
-        print("\n[ FASE DE PREPARACIÓN ]")
-        print(" 1. LUCHAR (Iniciar Negociación)")
-        print(" 2. INVENTARIO")
-        print(" 3. COMPENDIO")
-        print(" 4. AYUDA")
-
-        choice = input("\n> ").strip()
-        if choice == '1': return True
-        elif choice == '2': menu_inventory(session)
-        elif choice == '3': menu_roster(session)
-        elif choice == '4': menu_help()
+        sys.stdout.write(_LOBBY_MENU_TEXT)
+
+        choice = _option_index(input("\n> ").strip())
+        if choice == 1: return True
+        submenu = _LOBBY_MENUS.get(choice)
+        if submenu is None:
+            invalid += 1
+            if invalid >= MAX_PROMPT_RETRIES: return False
+            continue
+        invalid = 0
+        submenu(session)
+
+# ==============================================================================
+#  ACTION HANDLERS (menu option -> handler; False ends the loop)
+# ==============================================================================
+
+def _act_talk(session: NegotiationSession, cues: Dict, weights: Dict) -> bool:
+    q = session.pick_question()
+    if not q:
+        print(f"\n[{session.demon.name}] Se me acabaron las preguntas...")
+        session.turns_left = 0
+        session.check_union()
+        return False
+
+    # Question and options in a single write
+    lines = [f"\n[{_style(session.demon.name, 'RED')}]: {q.text}", ""]
+    lines += [f" {i+1}) {txt}" for i, (txt, _) in enumerate(q.responses)]
+    sys.stdout.write("\n".join(lines) + "\n")
+    valid_opts = [str(i+1) for i in range(len(q.responses))]
+    
+    # Answer (-1 after too many invalid tries: the engine ignores it)
+    ans_idx = -1
+    for _ in range(MAX_PROMPT_RETRIES):
+        sel = input("\nRespuesta > ").strip()
+        if sel in valid_opts:
+            ans_idx = int(sel) - 1
+            break
+    
+    feedback = session.process_answer(q, ans_idx, cues, weights)
+    
+    # Feedback Tone Translation
+    tone_es = feedback.tone
+    tone_color = "WHITE"
+    if feedback.tone == "HAPPY": 
+        tone_es = "FELIZ"
+        tone_color = "GREEN"
+    elif feedback.tone == "ANGRY": 
+        tone_es = "ENFADADO"
+        tone_color = "RED"
+    elif feedback.tone == "INTERESTED":
+        tone_es = "INTERESADO"
+        tone_color = "YELLOW"
+    elif feedback.tone == "BORED":
+        tone_es = "ABURRIDO"
+        tone_color = "BLUE"
+    
+    print(f"\n> ¡Parece {_style(tone_es, tone_color)}!")
+    wait_enter()
+    session.check_union()
+    return True
+
+def _act_item(session: NegotiationSession, cues: Dict, weights: Dict) -> bool:
+    menu_inventory(session)
+    return True
+
+def _act_bribe(session: NegotiationSession, cues: Dict, weights: Dict) -> bool:
+    msg = session.attempt_bribe()
+    # Assuming msg comes in English from engine, you might want to wrap translation there or here.
+    # For now, printing system msg directly.
+    print(f"\n[Sistema] {msg}")
+    wait_enter()
+    session.check_union()
+    return True
+
+def _act_flee(session: NegotiationSession, cues: Dict, weights: Dict) -> bool:
+    msg = session.attempt_flee()
+    print(f"\n[Sistema] {msg}")
+    wait_enter()
+    return True
+
+# Built once; the loop does one dict probe instead of walking an if/elif chain
+_ACTIONS: Dict[int, Callable[[NegotiationSession, Dict, Dict], bool]] = {
+    1: _act_talk,
+    2: _act_item,
+    3: _act_bribe,
+    4: _act_flee,
+}
 
 def run_game_loop(
     session: NegotiationSession, 
@@ -155,107 +298,64 @@ def run_game_loop(
     # 2. Logic Helpers (Callbacks for Engine)
     
     def cb_pay(amount: int, current: int) -> bool:
-        print(f" [Pide: {amount} Macca | Tienes: {current}]")
+        sys.stdout.write(f" [Pide: {amount} Macca | Tienes: {current}]\n")
         return ask_yes_no("¿Pagar la cantidad?")
 
     def cb_give(item_id: str, qty: int, current: int) -> bool:
-        print(f" [Pide: {qty}x {item_id} | Tienes: {current}]")
+        sys.stdout.write(f" [Pide: {qty}x {item_id} | Tienes: {current}]\n")
         return ask_yes_no("¿Entregar objeto?")
+
+    # Round pause is picked once so the loop never re-tests the delay
+    delay = config.SETTINGS.round_delay_sec
+    if delay > 0:
+        def maybe_sleep() -> None: time.sleep(delay)
+    else:
+        maybe_sleep = _noop
     
     # 3. Main Loop
+    # Bound once per negotiation (not at import, so redirected stdout is still honoured)
+    write = sys.stdout.write
+    invalid = 0 # consecutive unrecognised menu answers
+    paused = False # no pause before the very first round
     while session.in_progress:
+        # Single pause point: every round (whim or menu) waits the same, and a
+        # round that closes the session goes straight to the summary
+        if paused: maybe_sleep()
+        paused = True
         clear_screen()
-        print_header(session.player, session.demon, session.round_no, session.max_rounds)
-        print_rapport_bar(session.rapport, session.demon.rapport_needed)
 
         # --- EVENT TRIGGER (Whims) ---
+        whim_id = None
         if session.rng.random() < whim_config.get("base_chance", 0.1):
             whim_id = session.trigger_whim(whims, whim_config)
-            if whim_id:
-                res = session.process_event(
-                    {"id": whim_id}, 
-                    ask_yes_no, 
-                    cb_pay,     
-                    cb_give     
-                )
-                print(f"\n> {res.message}")
-                wait_enter()
-                
-                session.check_union()
-                if not session.in_progress: break
-                continue
-
-        # --- MENU ---
-        print(f"\n{_style('[ ACCIONES ]', 'BOLD')}")
-        print(" 1. HABLAR")
-        print(" 2. OBJETO")
-        print(" 3. SOBORNAR")
-        print(" 4. HUIR")
-        
-        action = input("\n> ").strip()
 
-        if action == '1': # TALK
-            q = session.pick_question()
-            if not q:
-                print(f"\n[{session.demon.name}] Se me acabaron las preguntas...")
-                session.turns_left = 0
-                session.check_union()
-                break
+        # A whim replaces the action menu for this round
+        write(render_turn(session, with_menu=not whim_id))
 
-            print(f"\n[{_style(session.demon.name, 'RED')}]: {q.text}")
-            
-            # Print Options
-            print("")
-            valid_opts = []
-            for i, (txt, _) in enumerate(q.responses):
-                print(f" {i+1}) {txt}")
-                valid_opts.append(str(i+1))
-            
-            # Answer
-            ans_idx = -1
-            while True:
-                sel = input("\nRespuesta > ").strip()
-                if sel in valid_opts:
-                    ans_idx = int(sel) - 1
-                    break
-            
-            feedback = session.process_answer(q, ans_idx, cues, weights)
-            
-            # Feedback Tone Translation
-            tone_es = feedback.tone
-            tone_color = "WHITE"
-            if feedback.tone == "HAPPY": 
-                tone_es = "FELIZ"
-                tone_color = "GREEN"
-            elif feedback.tone == "ANGRY": 
-                tone_es = "ENFADADO"
-                tone_color = "RED"
-            elif feedback.tone == "INTERESTED":
-                tone_es = "INTERESADO"
-                tone_color = "YELLOW"
-            elif feedback.tone == "BORED":
-                tone_es = "ABURRIDO"
-                tone_color = "BLUE"
-            
-            print(f"\n> ¡Parece {_style(tone_es, tone_color)}!")
-            wait_enter()
-            session.check_union()
-
-        elif action == '2': # ITEM
-            menu_inventory(session)
-
-        elif action == '3': # BRIBE
-            msg = session.attempt_bribe()
-            # Assuming msg comes in English from engine, you might want to wrap translation there or here.
-            # For now, printing system msg directly.
-            print(f"\n[Sistema] {msg}")
+        if whim_id:
+            res = session.process_event(
+                {"id": whim_id}, 
+                ask_yes_no, 
+                cb_pay,     
+                cb_give     
+            )
+            write(f"\n> {res.message}\n")
             wait_enter()
+            
+            # The while-condition already stops a closed session
             session.check_union()
+            continue
 
-        elif action == '4': # FLEE
-            msg = session.attempt_flee()
-            print(f"\n[Sistema] {msg}")
-            wait_enter()
+        # --- MENU ---
+        handler = _ACTIONS.get(_option_index(input("\n> ").strip()))
+        if handler is None:
+            invalid += 1
+            # Too many junk answers in a row: take the safe way out
+            if invalid >= MAX_PROMPT_RETRIES: handler = _act_flee
+        else:
+            invalid = 0
+        if handler is not None and not handler(session, cues, weights):
+            break
 
     # 4. End
     safe_uid = "".join(x for x in session.player.name if x.isalnum() or x in "_").lower()
@@ -289,17 +389,16 @@ def handle_end_game(session: NegotiationSession, user_id: str, demons_catalog: L
     # 3. SHOW SUMMARY
     clear_screen()
     print_header(session.player, session.demon)
-    print("\n" + "="*40)
-    print(" SESIÓN FINALIZADA ".center(40, " "))
-    print("="*40)
+    lines = ["\n" + "="*40, " SESIÓN FINALIZADA ".center(40, " "), "="*40]
     
     if session.recruited:
-        print(f"\n{_style('¡VICTORIA!', 'GREEN')} {session.demon.name} se unió a ti.")
+        lines.append(f"\n{_style('¡VICTORIA!', 'GREEN')} {session.demon.name} se unió a ti.")
     elif session.fled:
-        print(f"\n{_style('ESCAPASTE', 'YELLOW')} de la negociación.")
+        lines.append(f"\n{_style('ESCAPASTE', 'YELLOW')} de la negociación.")
     elif not session.in_progress and session.turns_left <= 0:
-        print(f"\n{_style('FALLO', 'RED')} Se acabó el tiempo.")
+        lines.append(f"\n{_style('FALLO', 'RED')} Se acabó el tiempo.")
     elif session.player.hp <= 0:
-        print(f"\n{_style('DERROTA', 'RED')} (Penalización aplicada).")
+        lines.append(f"\n{_style('DERROTA', 'RED')} (Penalización aplicada).")
+    sys.stdout.write("\n".join(lines) + "\n")
 
     wait_enter("Presiona Enter para volver al título...")
\ No newline at end of file
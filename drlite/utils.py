@@ -10,11 +10,21 @@ Conventions:
 
 from __future__ import annotations
 from typing import Any, Dict, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Sequence, Tuple, TypeVar
+from bisect import bisect_left
+from functools import lru_cache
+import json
+import os
 import random
 import re
+import sys
 
 T = TypeVar("T")
 
+try:
+    import orjson as _orjson  # optional: faster parse/serialize when installed
+except ImportError:
+    _orjson = None
+
 # ----------------------------
 # Numeric coercion & clamping
 # ----------------------------
@@ -45,27 +55,38 @@ def get_rng(seed: Optional[int] = None) -> random.Random:
     """Return a dedicated RNG; use 'random' module if you prefer global state."""
     return random.Random(seed) if seed is not None else random.Random()
 
-def weighted_choice(options: List[dict], weight_key: str = "weight") -> Optional[dict]:
+def cumulative_weights(options: Sequence[dict], weight_key: str = "weight", default: float = 0) -> List[float]:
+    """
+    Running totals of each option's weight (negatives count as 0).
+    Build once for a static table and pass to weighted_choice / rng.choices.
+    """
+    out: List[float] = []
+    total = 0.0
+    for opt in options:
+        w = float(opt.get(weight_key, default))
+        if w > 0:
+            total += w
+        out.append(total)
+    return out
+
+def weighted_choice(options: List[dict], weight_key: str = "weight",
+                    cum_weights: Optional[List[float]] = None) -> Optional[dict]:
     """
     Pick a single item from (item, weight) pairs.
-    Negative weights are treated as 0. If all weights <= 0, returns the first item.
+    Negative weights are treated as 0. If all weights <= 0, picks uniformly.
+    Pass precomputed `cum_weights` (see cumulative_weights) to skip the O(n) sum.
     """
 
     if not options:
         return None
-    
-    total = sum(float(x.get(weight_key, 0)) for x in options)
+
+    if cum_weights is None:
+        cum_weights = cumulative_weights(options, weight_key)
+    total = cum_weights[-1]
     if total <= 0:
         return random.choice(options)
-        
-    r = random.uniform(0, total)
-    upto = 0.0
-    for opt in options:
-        w = float(opt.get(weight_key, 0))
-        if upto + w >= r:
-            return opt
-        upto += w
-    return options[-1]
+
+    return options[bisect_left(cum_weights, random.uniform(0, total))]
 
 def choice(seq: Sequence[T], rng: Optional[random.Random] = None) -> T:
     """Random choice that accepts an optional RNG."""
@@ -95,13 +116,17 @@ def canonical_slug(s: str) -> str:
     s = re.sub(r"_+", "_", s)
     return s.strip("_")
 
+@lru_cache(maxsize=256)
 def canonical_item_id(raw_name: str) -> str:
     """
     Converts 'Life Stone' -> 'life_stone'.
+    Memoized and interned: the item vocabulary is small and ids repeat constantly,
+    so catalog, inventory and event keys all share one string object per id.
     """
     if not raw_name:
         return ""
-    return str(raw_name).strip().lower().replace(" ", "_")
+    s = raw_name if type(raw_name) is str else str(raw_name)
+    return sys.intern(s.strip().lower().replace(" ", "_"))
 
 def canonical_demon_id(name: str) -> str:
     """Canonical demon ID (slug)."""
@@ -128,6 +153,19 @@ def ensure_list_of_str(val: Any) -> List[str]:
         return [str(v) for v in val]
     return []
 
+def normalize_weight_tags(raw: Any) -> List[str]:
+    """
+    Tags as interned upper-case strings (the personality-weight key format).
+    A bare string is one tag; None -> [].
+    """
+    if raw is None:
+        return []
+    if isinstance(raw, str):
+        raw = [raw]
+    elif type(raw) is list and all(type(t) is str and t.isupper() for t in raw):
+        return raw # Already normalized (e.g. a cached tree seen before)
+    return [sys.intern(str(t).upper()) for t in raw]
+
 def unique_preserve_order(seq: Iterable[T]) -> List[T]:
     """De-duplicate preserving first-seen order."""
     seen: set = set()
@@ -159,18 +197,51 @@ def require_keys(d: Mapping[str, Any], keys: Sequence[str], ctx: str = "") -> No
         prefix = f"[{ctx}] " if ctx else ""
         raise KeyError(prefix + "Missing keys: " + ", ".join(missing))
 
+# ----------------------------
+# JSON (orjson when available)
+# ----------------------------
+
+def read_bytes(path: str) -> bytes:
+    """Whole file as bytes: one os.read sized from fstat, no buffered reader in between."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        chunk = os.read(fd, size + 1)  # +1 so a file that grew since fstat is noticed
+        if len(chunk) == size:
+            return chunk
+        parts = [chunk]
+        while chunk:
+            chunk = os.read(fd, 65536)
+            parts.append(chunk)
+        return b"".join(parts)
+    finally:
+        os.close(fd)
+
+def json_loads(raw: Any) -> Any:
+    """Parse JSON from bytes/str. Decode errors are json.JSONDecodeError either way."""
+    if _orjson is not None:
+        return _orjson.loads(raw)
+    return json.loads(raw)
+
+def json_dumps_pretty(obj: Any) -> bytes:
+    """Serialize to 2-space indented UTF-8 JSON bytes (plain str/int/list/dict data)."""
+    if _orjson is not None:
+        return _orjson.dumps(obj, option=_orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
 # ----------------------------
 # Feedback helpers (tone & cues)
 # ----------------------------
 
+# Indexed by sign(delta) + 1
+_TONE_BY_SIGN = ("molesto", "pensativo", "contento")
+
 def tone_from_delta(delta: int) -> str:
     """
     Map rapport delta -> coarse tone label.
     Keep it free of game classes to avoid imports.
     """
-    if delta > 0: return "contento"    
-    if delta < 0: return "molesto"    
-    return "pensativo"                 
+    return _TONE_BY_SIGN[(delta > 0) - (delta < 0) + 1]
 
 
 def flavor_cue(personality_enum: Any, tone: str, cues_data: Dict[str, Any], default: str = "...") -> str:
@@ -226,8 +297,9 @@ _tone_from_delta = tone_from_delta
 
 __all__ = [
     "coerce_int", "coerce_float", "clamp",
-    "get_rng", "weighted_choice", "choice", "randint_range",
+    "get_rng", "cumulative_weights", "weighted_choice", "choice", "randint_range",
     "canonical_slug", "canonical_item_id", "canonical_demon_id", "normalize_tag",
-    "ensure_list_of_str", "unique_preserve_order", "nested_get", "require_keys",
+    "ensure_list_of_str", "normalize_weight_tags", "unique_preserve_order", "nested_get", "require_keys",
+    "read_bytes", "json_loads", "json_dumps_pretty",
     "tone_from_delta", "flavor_cue", "resolve_event_ref"
 ]
\ No newline at end of file
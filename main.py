@@ -1,25 +1,33 @@
 from __future__ import annotations
 import random
 import re
-from drlite.config import load_config, RNG_SEED
+import sys
+from typing import Optional
+from drlite import config
+from drlite.config import load_config
 from drlite.data.loaders import (
     load_demons, load_questions, load_personality_weights, 
-    load_personality_cues, load_item_catalog, load_events, load_whims
+    load_personality_cues, load_item_catalog, load_events, load_whims, preload_json
 )
 from drlite.assets.manifest import load_assets_manifest
-from drlite.ui.console import print_banner, read_difficulty
+from drlite.ui.console import print_banner, read_difficulty, MAX_PROMPT_RETRIES
 from drlite.ui.gameplay import run_game_loop 
 from drlite.persistence.io import load_game, save_game 
 from drlite.engine.session import NegotiationSession
 
 # --- HELPER: INPUT USER ---
-def ask_player_identity() -> tuple[str, str]:
-    print("\n" + "="*40)
-    print(" BIENVENIDO AL MUNDO DE LAS SOMBRAS ".center(40, " "))
-    print("="*40)
-    print("\n[Sistema] Identifícate para acceder a tu Registro.")
+_LOGIN_HEADER = (
+    "\n" + "=" * 40 + "\n"
+    + " BIENVENIDO AL MUNDO DE LAS SOMBRAS ".center(40, " ") + "\n"
+    + "=" * 40 + "\n"
+    "\n[Sistema] Identifícate para acceder a tu Registro.\n"
+)
+
+def ask_player_identity() -> Optional[tuple[str, str]]:
+    """(safe_id, display name), or None after too many unusable names."""
+    sys.stdout.write(_LOGIN_HEADER)
     
-    while True:
+    for _ in range(MAX_PROMPT_RETRIES):
         raw_name = input("Nombre de Usuario > ").strip()
         if not raw_name:
             continue
@@ -32,14 +40,21 @@ def ask_player_identity() -> tuple[str, str]:
             continue
             
         return safe_id, raw_name
+    return None
 
 def main() -> None:
     print_banner()
     load_config("config.json")
-    rng = random.Random(RNG_SEED) if RNG_SEED is not None else random.Random()
+    seed = config.SETTINGS.rng_seed
+    rng = random.Random(seed) if seed is not None else random.Random()
 
     # 1. LOAD DATA
     print("[Sistema] Cargando recursos...")
+    preload_json([
+        "data/personality_weights.json", "data/personality_cues.json", "data/items.json",
+        "data/events.json", "data/whims.json", "data/demons.json", "data/questions.json",
+        "data/assets_manifest.json",
+    ])
     p_weights = load_personality_weights("data/personality_weights.json")
     p_cues = load_personality_cues("data/personality_cues.json")
     items_cat = load_item_catalog("data/items.json")
@@ -50,7 +65,11 @@ def main() -> None:
     questions_pool = load_questions("data/questions.json")
 
     # 2. LOGIN
-    user_id, display_name = ask_player_identity()
+    identity = ask_player_identity()
+    if identity is None:
+        print("\n[Sistema] No se pudo identificar al usuario. Saliendo.")
+        return
+    user_id, display_name = identity
     player, demons_catalog = load_game(user_id, demons_catalog)
 
     # New User Check